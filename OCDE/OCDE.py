@@ -1,7 +1,11 @@
 from .backend.backend import State
+from .backend.api import api
+from .backend.dataset import watch_data_files
+from .backend.static_export import export_static_profiles
 from .views.navbar import navbar
 from .views.table import main_table, pub_table
-from .views.stats import stats_ui
+from .views.stats import StatsState, stats_ui
+from .views.indicadores import GeneroState, indicadores_genero
 from .views.footer import footer
 from .views.searchbar import navbar_searchbar, navbar_searchbar_notsearch
 from .views.repositorio import repo_menu
@@ -15,6 +19,8 @@ from .views.home import (
 )
 from .views.carousel import carousel
 from .views.filtros import areas_selector
+from .views.busqueda import busqueda_global
+from .views.exportar import export_menu
 from .components.chatbot import chatbot_assistant
 import reflex as rx
 from reflex.components.core.breakpoints import Breakpoints
@@ -41,45 +47,20 @@ def obs_inicio():
 
 
 # Página de indicadores
-@rx.page(route="/obs_indicadores", title="Indicadores")
+@rx.page(
+    route="/obs_indicadores",
+    title="Indicadores",
+    on_load=GeneroState.load_indicadores,
+)
 def obs_indicadores():
     return rx.vstack(
         huincha(),
         banner_generator("/banner_indicadores.png"),
         navbar_main(),
         rx.box(
-            rx.desktop_only(
-                rx.html(
-                    """
-                    <iframe
-                        title='indicadores_ines_genero_v2'
-                        src='https://app.powerbi.com/view?r=eyJrIjoiZjM2MGFmMzgtNzllMi00YjkyLWIxNjItMDIxNGZjMDZmZGExIiwidCI6ImZjZDlhYmQ4LWRmY2QtNGExYS1iNzE5LThhMTNhY2ZkNWVkOSIsImMiOjR9'
-                        frameborder='0'
-                        allowFullScreen='true'
-                        width='800'
-                        height='636'
-                        style='aspect-ratio: 16/9; width: 100%;'
-                    ></iframe>
-                    """
-                ),
-                class_name="p-10",
-            ),
-            rx.mobile_and_tablet(
-                rx.html(
-                    """
-                    <iframe
-                        title='indicadores_ines_genero_v2'
-                        src='https://app.powerbi.com/view?r=eyJrIjoiZjM2MGFmMzgtNzllMi00YjkyLWIxNjItMDIxNGZjMDZmZGExIiwidCI6ImZjZDlhYmQ4LWRmY2QtNGExYS1iNzE5LThhMTNhY2ZkNWVkOSIsImMiOjR9'
-                        frameborder='0'
-                        allowFullScreen='true'
-                        style='aspect-ratio: 16/9; width: 100%;'
-                    ></iframe>
-                    """
-                ),
-            ),
+            indicadores_genero(),
             width="100%",
-            class_name="sm:p-2 px-3 justify-center items-center",
-            style={"overflowX": "hidden"},
+            class_name="sm:p-10 p-3",
         ),
         superbanner(),
         footer_inst(),
@@ -89,7 +70,11 @@ def obs_indicadores():
 
 
 # Página de indicadores
-@rx.page(route="/obs_otros_indicadores", title="Otros Indicadores")
+@rx.page(
+    route="/obs_otros_indicadores",
+    title="Otros Indicadores",
+    on_load=StatsState.load_stats,
+)
 def obs_indicadores():
     return rx.vstack(
         huincha(),
@@ -129,6 +114,11 @@ def obs_indicadores():
             class_name="sm:p-2 px-3 justify-center items-center",
             style={"overflowX": "hidden"},
         ),
+        rx.box(
+            stats_ui(),
+            width="100%",
+            class_name="p-10",
+        ),
         superbanner(),
         footer_inst(),
         spacing="0",
@@ -230,6 +220,7 @@ def academicas():
         navbar_main(),
         navbar_searchbar(),
         areas_selector(),
+        busqueda_global(),
         rx.flex(
             rx.hstack(
                 rx.foreach(State.filtered_investigators, investigador_card),
@@ -240,6 +231,7 @@ def academicas():
             flex="1",
             spacing="3",
         ),
+        _directory_pagination(),
         footer_inst(),
         spacing="0",
         align="stretch",
@@ -249,8 +241,41 @@ def academicas():
         class_name="w-full h-auto",
     )
 
+def _directory_pagination() -> rx.Component:
+    return rx.hstack(
+        rx.text(
+            f"{State.directory_total} investigadoras · Página ",
+            rx.code(State.directory_page),
+            f" de {State.directory_pages}",
+            class_name="text-indigo-900",
+        ),
+        rx.hstack(
+            rx.icon_button(
+                rx.icon("chevron-left", size=18),
+                on_click=State.directory_prev_page,
+                disabled=State.directory_page == 1,
+                color_scheme="indigo",
+                variant="solid",
+            ),
+            rx.icon_button(
+                rx.icon("chevron-right", size=18),
+                on_click=State.directory_next_page,
+                disabled=State.directory_page == State.directory_pages,
+                color_scheme="indigo",
+                variant="solid",
+            ),
+            spacing="2",
+        ),
+        export_menu("investigadoras"),
+        justify="center",
+        align="center",
+        spacing="5",
+        class_name="w-full p-5",
+    )
+
+
 def investigador_card(
-    inv, on_load=[State.load_academicas, State.load_entries_pub, State.load_entries]
+    inv, on_load=[State.load_academicas, State.load_profile]
 ):
     return rx.card(
         rx.vstack(
@@ -334,7 +359,17 @@ def _tabs_trigger(text: str, icon: str, value: str):
 # Página perfil del investigador
 @rx.page(
     route="/investigadora/[id]",
-    on_load=[State.load_entries_pub, State.load_entries, State.load_grid_data],
+    on_load=State.load_profile,
+    # La versión estática del perfil (ver static_export.py) es la que
+    # indexan los buscadores
+    meta=[
+        rx.el.link(rel="canonical", href=f"{State.perfil_estatico}.html"),
+        rx.el.link(
+            rel="alternate",
+            type="application/json",
+            href=f"{State.perfil_estatico}.json",
+        ),
+    ],
 )
 def investigator_page():
     """Muestra el detalle del investigador según el índice en la URL."""
@@ -771,6 +806,8 @@ base_style = {
 
 # Aplicación principal de Reflex, backend y frontend
 app = rx.App(
+    # API JSON de solo lectura en /api
+    api_transformer=api,
     style=base_style,
     stylesheets=base_stylesheets,
     theme=rx.theme(
@@ -794,3 +831,8 @@ app = rx.App(
         ),
     ],
 )
+
+# Recarga los datos cuando se reemplazan los archivos de origen
+app.register_lifespan_task(watch_data_files)
+# Publica perfiles estáticos (JSON y HTML) que Caddy sirve en /perfiles/
+app.register_lifespan_task(export_static_profiles)
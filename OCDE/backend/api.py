@@ -0,0 +1,335 @@
+"""
+API JSON de solo lectura sobre la instantánea de datos.
+
+Se monta en el backend de Reflex (`api_transformer`) bajo /api:
+
+    GET /api/estado
+    GET /api/investigadoras?limit=&cursor=&fields=
+    GET /api/investigadoras/{id}?fields=
+    GET /api/proyectos?rut_ir=&limit=&cursor=&fields=
+    GET /api/publicaciones?rut_ir=&limit=&cursor=&fields=
+    GET /api/indicadores/genero?por=&año=&disciplina=&unidad=&cuartil=
+    GET /api/exportar/investigadoras?formato=&q=&areas=
+    GET /api/exportar/{proyectos|publicaciones}?rut_ir=&formato=&q=&orden=&desc=
+
+Las respuestas de datos llevan un ETag derivado de la huella de la
+instantánea y de `api_version`: un cliente que repite la consulta con
+`If-None-Match` recibe 304 sin que se vuelva a construir la respuesta. Los
+cursores son opacos e incluyen esa misma versión; si los datos cambian entre
+una página y la siguiente se responde 410.
+
+Todas las respuestas salen de la instantánea en memoria (también con base de
+datos), de modo que el ETag y los cursores siempre describen las mismas filas.
+
+Las exportaciones se envían en streaming (ver `export.py`) con los mismos
+filtros que aplica la interfaz.
+"""
+
+import base64
+from typing import Callable, List, Optional, Sequence, Type
+
+import reflex as rx
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from . import export
+from .dataset import Dataset, dataset_info, get_dataset
+from .models import Investigador, Proyectos, Publicaciones
+from .records import (
+    InvestigadorRecord,
+    ProyectoRecord,
+    PublicacionRecord,
+    private_fields,
+    proyecto_sort_fields,
+    publicacion_sort_fields,
+    to_model,
+    to_models,
+)
+from .stats import gender_dimensions, gender_shares
+
+default_limit = 50
+max_limit = 500
+
+# Versión de la forma de las respuestas. Forma parte del ETag y de los
+# cursores: debe subirse cada vez que cambien los campos o la estructura de
+# una respuesta, para que los clientes no sigan recibiendo 304 con la anterior.
+api_version = 1
+
+api = FastAPI(
+    title="Investigadoras UFRO",
+    docs_url="/api/docs",
+    redoc_url=None,
+    openapi_url="/api/openapi.json",
+)
+api.add_middleware(GZipMiddleware, minimum_size=1000)
+
+
+def _version(dataset: Dataset) -> str:
+    """Versión de los datos y de la forma de las respuestas."""
+    return f"{api_version}-{dataset.fingerprint()}"
+
+
+def _etag(dataset: Dataset) -> str:
+    return f'W/"{_version(dataset)}"'
+
+
+def _matches(if_none_match: str, etag: str) -> bool:
+    """Compara `etag` con la lista de `If-None-Match` (comparación débil)."""
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag.removeprefix("W/") in {
+        tag.removeprefix("W/") for tag in tags
+    }
+
+
+def _respond(request: Request, build: Callable[[Dataset], dict]) -> Response:
+    """Responde 304 si el cliente ya tiene esta versión; si no, `build(dataset)`."""
+    dataset = get_dataset()
+    etag = _etag(dataset)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _matches(request.headers.get("if-none-match", ""), etag):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(build(dataset), headers=headers)
+
+
+def _fields(model: Type[rx.Base], fields: Optional[str]) -> List[str]:
+    """Campos pedidos en `fields` (separados por coma), validados contra el modelo."""
+    available = [f for f in model.__fields__ if f not in private_fields]
+    if not fields:
+        return available
+    selected = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in selected if f not in available]
+    if unknown:
+        raise HTTPException(400, f"Campos desconocidos: {', '.join(unknown)}")
+    return selected
+
+
+def _encode_cursor(dataset: Dataset, offset: int) -> str:
+    raw = f"{_version(dataset)}:{offset}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(dataset: Dataset, cursor: Optional[str]) -> int:
+    if not cursor:
+        return 0
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        version, offset = raw.rsplit(":", 1)
+        offset = int(offset)
+    except ValueError:
+        raise HTTPException(400, "Cursor inválido")
+    if offset < 0:
+        raise HTTPException(400, "Cursor inválido")
+    if version != _version(dataset):
+        raise HTTPException(410, "Los datos cambiaron; vuelva a la primera página")
+    return offset
+
+
+def _page(
+    dataset: Dataset,
+    model: Type[rx.Base],
+    records: Sequence[tuple],
+    limit: int,
+    cursor: Optional[str],
+    fields: Optional[str],
+) -> dict:
+    if not 1 <= limit <= max_limit:
+        raise HTTPException(400, f"limit debe estar entre 1 y {max_limit}")
+    selected = _fields(model, fields)
+    offset = _decode_cursor(dataset, cursor)
+    window = records[offset : offset + limit]
+    end = offset + len(window)
+    return {
+        "total": len(records),
+        "items": [
+            {f: item[f] for f in selected}
+            for item in (m.dict() for m in to_models(model, window))
+        ],
+        "next_cursor": _encode_cursor(dataset, end) if end < len(records) else None,
+    }
+
+
+@api.get("/api/estado")
+def estado():
+    # Sin ETag: las estadísticas de la caché de filtros cambian sin que
+    # cambie la instantánea
+    return JSONResponse(dataset_info(), headers={"Cache-Control": "no-store"})
+
+
+@api.get("/api/investigadoras")
+def investigadoras(
+    request: Request,
+    limit: int = default_limit,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+):
+    return _respond(
+        request,
+        lambda dataset: _page(
+            dataset, Investigador, dataset.investigadores, limit, cursor, fields
+        ),
+    )
+
+
+@api.get("/api/investigadoras/{inv_id}")
+def investigadora(request: Request, inv_id: int, fields: Optional[str] = None):
+    def build(dataset: Dataset) -> dict:
+        bundle = dataset.perfiles.get(inv_id)
+        if bundle is None:
+            raise HTTPException(404, "Investigadora no encontrada")
+        selected = _fields(Investigador, fields)
+        item = to_model(Investigador, bundle.investigador).dict()
+        return {
+            **{f: item[f] for f in selected},
+            "n_proyectos": bundle.n_proyectos,
+            "n_publicaciones": bundle.n_publicaciones,
+        }
+
+    return _respond(request, build)
+
+
+@api.get("/api/proyectos")
+def proyectos(
+    request: Request,
+    rut_ir: str,
+    limit: int = default_limit,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+):
+    return _respond(
+        request,
+        lambda dataset: _page(
+            dataset,
+            Proyectos,
+            dataset.proyectos_records(rut_ir),
+            limit,
+            cursor,
+            fields,
+        ),
+    )
+
+
+@api.get("/api/publicaciones")
+def publicaciones(
+    request: Request,
+    rut_ir: str,
+    limit: int = default_limit,
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+):
+    return _respond(
+        request,
+        lambda dataset: _page(
+            dataset,
+            Publicaciones,
+            dataset.publicaciones_records(rut_ir),
+            limit,
+            cursor,
+            fields,
+        ),
+    )
+
+
+@api.get("/api/indicadores/genero")
+def indicadores_genero(
+    request: Request,
+    por: str = "año",
+    año: Optional[str] = None,
+    disciplina: Optional[str] = None,
+    unidad: Optional[str] = None,
+    cuartil: Optional[str] = None,
+):
+    if por not in gender_dimensions:
+        raise HTTPException(400, f"No se puede agrupar por {por}")
+    selected = {
+        "año": año,
+        "disciplina": disciplina,
+        "unidad": unidad,
+        "cuartil": cuartil,
+    }
+    filters = {dim: [value] for dim, value in selected.items() if value}
+
+    def build(dataset: Dataset) -> dict:
+        cube = dataset.genero
+        return {
+            "total": gender_shares(cube.totals(filters)),
+            "items": [gender_shares(row) for row in cube.slice(por, filters)],
+        }
+
+    return _respond(request, build)
+
+
+def _download(
+    dataset: Dataset, name: str, record_type, records, formato: str
+) -> StreamingResponse:
+    if formato not in export.media_types:
+        raise HTTPException(400, f"Formato desconocido: {formato}")
+    filename = f"{name}-{dataset.fingerprint()[:8]}.{formato}"
+    return StreamingResponse(
+        export.stream(records, export.columns(record_type), formato),
+        media_type=export.media_types[formato],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Cache-Control": "no-store",
+        },
+    )
+
+
+@api.get("/api/exportar/investigadoras")
+def exportar_investigadoras(
+    formato: str = "csv",
+    q: str = "",
+    areas: List[str] = Query([]),
+):
+    dataset = get_dataset()
+    return _download(
+        dataset,
+        "investigadoras",
+        InvestigadorRecord,
+        export.investigadoras(dataset, q, areas),
+        formato,
+    )
+
+
+@api.get("/api/exportar/proyectos")
+def exportar_proyectos(
+    rut_ir: str,
+    formato: str = "csv",
+    q: str = "",
+    orden: str = "",
+    desc: bool = False,
+):
+    if orden and orden not in proyecto_sort_fields:
+        raise HTTPException(400, f"No se puede ordenar por {orden}")
+    dataset = get_dataset()
+    records = dataset.proyectos_records(rut_ir)
+    rows = dataset.buscar_proyectos(rut_ir, q) if q else None
+    return _download(
+        dataset,
+        f"proyectos-{rut_ir}",
+        ProyectoRecord,
+        export.tabla(records, rows, orden, desc),
+        formato,
+    )
+
+
+@api.get("/api/exportar/publicaciones")
+def exportar_publicaciones(
+    rut_ir: str,
+    formato: str = "csv",
+    q: str = "",
+    orden: str = "",
+    desc: bool = False,
+):
+    if orden and orden not in publicacion_sort_fields:
+        raise HTTPException(400, f"No se puede ordenar por {orden}")
+    dataset = get_dataset()
+    records = dataset.publicaciones_records(rut_ir)
+    rows = dataset.buscar_publicaciones(rut_ir, q) if q else None
+    return _download(
+        dataset,
+        f"publicaciones-{rut_ir}",
+        PublicacionRecord,
+        export.tabla(records, rows, orden, desc),
+        formato,
+    )
@@ -1,18 +1,52 @@
 import reflex as rx
 import asyncio
-from .data_items import all_items
-import pandas as pd
-import numpy as np
+import logging
+import urllib.parse
 from .models import Investigador, Publicaciones, Proyectos
-from typing import Dict, List, Optional, TypedDict
-
-
-proyectos_csv = "proyectos_total_ocde1_.csv"
-
-# academicas_csv = "academicas_clean.csv"
-academicas_csv = "academicas.xlsx"
-
-publicaciones_csv = "publicaciones___.csv"
+from .cache import filter_cache
+from .dataset import dataset_for, get_dataset, get_dataset_async
+from .indexes import TrigramIndex
+from .profiles import profile_page_size
+from .static_export import site_url
+from .stats import filter_dimensions
+from .records import (
+    ProyectoRecord,
+    proyecto_search_fields,
+    proyecto_sort_fields,
+    publicacion_search_fields,
+    publicacion_sort_fields,
+    sort_order,
+    to_model,
+    to_models,
+)
+from typing import Dict, List, Optional, Sequence, TypedDict
+
+logger = logging.getLogger(__name__)
+
+# Espera (en segundos) tras la última tecla antes de aplicar una búsqueda
+search_debounce = 0.3
+
+# Búsquedas que se aplican con espera; cada una tiene un campo `<nombre>_input`
+# con el texto que se está escribiendo
+debounced_searches = (
+    "search_term",
+    "global_search_term",
+    "search_value_proy",
+    "search_value_pub",
+)
+
+
+def _filter_order(order: Sequence[int], rows: Sequence[int]) -> Sequence[int]:
+    """`order` restringido a las posiciones de `rows`."""
+    if len(rows) == len(order):
+        return order
+    keep = set(rows)
+    return [row for row in order if row in keep]
+
+
+def _page(rows: Sequence[int], offset: int, limit: int) -> Sequence[int]:
+    """Ventana `[offset, offset + limit)` de `rows`."""
+    return rows[offset : offset + limit]
 
 
 class State(rx.State):
@@ -38,26 +72,51 @@ class State(rx.State):
     ]
     current_index: int = 0
 
-    proyectos: list[Proyectos] = []
-    investigadores: list[Investigador] = []
-    publicaciones: list[Publicaciones] = []
-    grid_data: list[dict] = []
-    grid_data2: list[dict] = []
+    # Versión de la instantánea de datos vista por la sesión
+    dataset_version: int = 0
+
+    # Registros compactos de la investigadora abierta; se convierten a modelos
+    # solo al enviarlos al navegador. Las colecciones completas y sus índices
+    # se leen de la instantánea (`_snapshot`) y no se guardan en la sesión.
+    _proyectos: tuple = ()
+    _publicaciones: tuple = ()
+    # Posición de `_proyectos` y `_publicaciones` dentro de la instantánea
+    _proyectos_inicio: int = 0
+    _publicaciones_inicio: int = 0
+    # Id de la investigadora abierta, para leer su resumen precalculado
+    _perfil_id: int = 0
 
     search_value: str = ""
     search_value_pub: str = ""
     search_value_proy: str = ""
+    search_value_pub_input: str = ""
+    search_value_proy_input: str = ""
     search_value_card: str = ""
-    sort_value: str = ""
-    sort_reverse: bool = False
+    # Orden de cada tabla del perfil: columna ("" = orden original) y sentido
+    sort_value_proy: str = ""
+    sort_reverse_proy: bool = False
+    sort_value_pub: str = ""
+    sort_reverse_pub: bool = False
     search_term: str = ""
+    search_term_input: str = ""
+    # Búsqueda global en todos los proyectos y publicaciones
+    global_search_term: str = ""
+    global_search_term_input: str = ""
+    # Número de la última tecla recibida por búsqueda; una espera que ya no
+    # corresponde a la última tecla se descarta sin calcular nada
+    _search_seq: Dict[str, int] = {}
     filtered_count: int = 0
-    filtered_year: list = []
+    # año → cantidad de proyectos de la investigadora abierta
+    _year_histogram: Dict[int, int] = {}
     filtered_count_pub: int = 0
 
-    total_items: int = 0
     total_investigadores: int = 0
-    offset: int = 0
+    # Página visible del directorio de investigadoras
+    directory_offset: int = 0
+    directory_limit: int = 24
+    # Página visible de cada tabla del perfil
+    offset_proy: int = 0
+    offset_pub: int = 0
     limit: int = 24  # Number of rows per page
 
     name: str = ""
@@ -66,9 +125,9 @@ class State(rx.State):
     city: str = ""
     message: str = ""
 
-    selected_items: Dict[str, List] = (
-        all_items  # We add all items to the selected items by default
-    )
+    # Valores elegidos en cada filtro de la página de estadísticas; al entrar
+    # a la página se marcan todos los del cubo
+    selected_items: Dict[str, List] = {key: [] for key in filter_dimensions}
 
     # 13/01/2025
     # Áreas disponibles y seleccionadas (ajústalas a tu gusto)
@@ -120,11 +179,13 @@ class State(rx.State):
     def add_area(self, area: str):
         if area not in self.selected_areas:
             self.selected_areas.append(area)
+            self.directory_offset = 0
 
     @rx.event
     def remove_area(self, area: str):
         if area in self.selected_areas:
             self.selected_areas.remove(area)
+            self.directory_offset = 0
 
     @rx.event
     def select_all_areas(self):
@@ -133,36 +194,89 @@ class State(rx.State):
     @rx.event
     def clear_areas(self):
         self.selected_areas.clear()
+        self.directory_offset = 0
 
-    @rx.var
+    @rx.var(backend=True)
     def year_list(self) -> list:
-        return self.filtered_year
+        return list(self._year_histogram)
+
+    @rx.var(backend=True)
+    def filtered_ids(self) -> tuple:
+        """Ids de todas las investigadoras que cumplen el filtro.
+
+        Se guardan ids y no posiciones: si la instantánea de la sesión ya no se
+        conserva, `_snapshot()` entrega la vigente, cuya lista es otra.
+        """
+        if not self.dataset_version:
+            return ()
+        dataset = self._snapshot()
+        # La clave es la versión de la instantánea que realmente se filtra,
+        # no la de la sesión
+        rows = filter_cache.get(
+            dataset.version,
+            self.search_term,
+            self.selected_areas,
+            lambda: dataset.filtrar(self.search_term, self.selected_areas),
+        )
+        return tuple(dataset.investigadores[row].id for row in rows)
+
+    @rx.var
+    def directory_total(self) -> int:
+        return len(self.filtered_ids)
 
     @rx.var
     def filtered_investigators(self) -> list[Investigador]:
-        term = self.search_term.lower().strip()
-        if term:
-            filtered = [
-                inv
-                for inv in self.investigadores
-                if (term in str(inv.id))
-                or (term in inv.name.lower())
-                or (term in inv.ocde_2.lower())
-                # or (term in inv.titulo.lower())
-                # or (term in inv.programa.lower())
-            ]
-        else:
-            filtered = self.investigadores
-        # if self.selected_areas:
-        #     filtered = [inv for inv in filtered if inv.ocde_2 in self.selected_areas]
-        if self.selected_areas:
-            filtered = [
-                inv
-                for inv in filtered
-                if all(area in inv.ocde_2 for area in self.selected_areas)
-            ]
+        """Solo la página visible del directorio."""
+        offset = self.directory_offset
+        if offset >= len(self.filtered_ids):
+            offset = 0
+        ids = self.filtered_ids[offset : offset + self.directory_limit]
+        por_id = self._snapshot().investigadores_por_id if ids else {}
+        return to_models(Investigador, [por_id[i] for i in ids if i in por_id])
+
+    @rx.var
+    def directory_page(self) -> int:
+        if self.directory_offset >= self.directory_total:
+            return 1
+        return self.directory_offset // self.directory_limit + 1
+
+    @rx.var
+    def directory_pages(self) -> int:
+        return max(1, -(-self.directory_total // self.directory_limit))
+
+    @rx.event
+    def directory_prev_page(self):
+        self.directory_offset = max(0, self.directory_offset - self.directory_limit)
+
+    @rx.event
+    def directory_next_page(self):
+        if self.directory_offset + self.directory_limit < self.directory_total:
+            self.directory_offset += self.directory_limit
 
-        return filtered
+    @rx.var
+    def global_results(self) -> list[dict[str, str]]:
+        term = self.global_search_term.strip()
+        if not term or not self.dataset_version:
+            return []
+        dataset = self._snapshot()
+        results = []
+        for record, score in dataset.buscar(term, k=20):
+            inv = dataset.investigadores_por_rut.get(record.rut_ir)
+            es_proyecto = isinstance(record, ProyectoRecord)
+            results.append(
+                {
+                    "tipo": "Proyecto" if es_proyecto else "Publicación",
+                    "titulo": record.titulo,
+                    "detalle": str(
+                        record.tipo_proyecto if es_proyecto else record.revista
+                    ),
+                    "año": str(record.año),
+                    "investigadora": inv.name if inv else "",
+                    "investigadora_id": str(inv.id) if inv else "",
+                    "puntaje": f"{score:.2f}",
+                }
+            )
+        return results
 
     @rx.var
     def sorted_areas(self) -> list[str]:
@@ -195,106 +309,164 @@ class State(rx.State):
         else:
             return "??"
 
-    @rx.event
-    def load_grid_data(self):
-        if self.current_investigator:
-            df_proyectos = pd.read_csv(proyectos_csv, encoding="utf-8-sig")
-            df_publicaciones = pd.read_csv(publicaciones_csv, encoding="utf-8-sig")
-            # Filter your dataframe based on current_investigator
-            filtered_data = df_proyectos[
-                df_proyectos["rut_ir"] == self.current_investigator.rut_ir
-            ]
+    def _sync_dataset(self, dataset=None):
+        """Toma la instantánea vigente y registra su versión en la sesión."""
+        dataset = dataset or get_dataset()
+        # Asignar la misma versión igual marcaría como modificadas todas las
+        # variables calculadas que dependen de ella
+        if self.dataset_version != dataset.version:
+            self.dataset_version = dataset.version
+        return dataset
 
-            filtered_pub = df_publicaciones[
-                df_publicaciones["rut_ir"] == self.current_investigator.rut_ir
-            ]
+    async def _load_dataset(self):
+        """Como `_sync_dataset`, sin bloquear el bucle si hay que construirla."""
+        return self._sync_dataset(await get_dataset_async())
 
-            filtered_year = df_proyectos[
-                df_proyectos["rut_ir"] == self.current_investigator.rut_ir
-            ]["año"]
+    def _snapshot(self):
+        """Instantánea con la que la sesión cargó sus datos (o la vigente)."""
+        return dataset_for(self.dataset_version)
 
-            self.grid_data = filtered_data.to_dict("records")
-            self.grid_data2 = filtered_pub.to_dict("records")
-            self.filtered_count = int(len(filtered_data))
-            self.filtered_year = filtered_year.to_list()
-            self.filtered_count_pub = int(len(filtered_pub))
+    @rx.event
+    async def load_profile(self):
+        """Carga el perfil de la ruta y lo aplica en una sola actualización.
+
+        Solo la construcción de la instantánea (en la primera carga) se espera
+        en un hilo; el perfil sale de búsquedas por id ya indexadas.
+        """
+        try:
+            perfil_id = int(self.id)
+        except (TypeError, ValueError):
+            perfil_id = 0
+        dataset = await self._load_dataset()
+        investigador = dataset.investigadores_por_id.get(perfil_id)
+        if investigador is None:
+            logger.warning(f"No existe la investigadora {self.id}")
+            return
+        bundle = dataset.perfiles[perfil_id]
+        proyectos = dataset.proyectos_records(investigador.rut_ir)
+        publicaciones = dataset.publicaciones_records(investigador.rut_ir)
+
+        self._perfil_id = perfil_id
+        self._proyectos = proyectos
+        self._proyectos_inicio = bundle.proyectos_rows.start
+        self._publicaciones = publicaciones
+        self._publicaciones_inicio = bundle.publicaciones_rows.start
+        self.offset_proy = 0
+        self.offset_pub = 0
+        self.filtered_count = bundle.n_proyectos
+        self.filtered_count_pub = bundle.n_publicaciones
+        self._year_histogram = bundle.años_proyectos
+
+    def _first_page(self, table: str):
+        """Primera página precalculada de la tabla, si es la que se muestra."""
+        if self.limit != profile_page_size:
+            return None
+        bundle = self._snapshot().perfiles.get(self._perfil_id)
+        if bundle is None or self._snapshot().version != self.dataset_version:
+            return None
+        if table == "proy":
+            return list(bundle.primeros_proyectos)
+        return list(bundle.primeras_publicaciones)
 
     def set_search_term(self, term: str):
         """Actualiza la búsqueda."""
-        self.search_term = term
+        self._apply_search("search_term", term)
+
+    def _apply_search(self, name: str, value: str):
+        """Aplica una búsqueda de inmediato y descarta las esperas pendientes."""
+        self._search_seq = {**self._search_seq, name: self._search_seq.get(name, 0) + 1}
+        setattr(self, f"{name}_input", value)
+        setattr(self, name, value)
+        self._search_applied(name)
+
+    def _search_applied(self, name: str):
+        """Vuelve a la primera página de lo que filtra la búsqueda `name`."""
+        if name == "search_term":
+            self.directory_offset = 0
+        elif name == "search_value_proy":
+            self.offset_proy = 0
+        elif name == "search_value_pub":
+            self.offset_pub = 0
 
-    @rx.var(cache=False)
+    @rx.event
+    def type_search(self, name: str, value: str):
+        """Guarda lo que se escribe y programa la búsqueda tras `search_debounce`."""
+        if name not in debounced_searches:
+            return
+        seq = self._search_seq.get(name, 0) + 1
+        self._search_seq = {**self._search_seq, name: seq}
+        setattr(self, f"{name}_input", value)
+        return State.apply_typed_search(name, seq)
+
+    @rx.event
+    def clear_search(self, name: str):
+        if name in debounced_searches:
+            self._apply_search(name, "")
+
+    @rx.event
+    def exportar(self, tabla: str, formato: str):
+        """Descarga el resultado filtrado del directorio o de una tabla del perfil.
+
+        El archivo lo genera en streaming la API; aquí solo se arma la URL con
+        los filtros aplicados en pantalla.
+        """
+        if tabla == "investigadoras":
+            params = {"q": self.search_term, "areas": self.selected_areas}
+        elif tabla in ("proyectos", "publicaciones") and self.current_investigator:
+            proy = tabla == "proyectos"
+            params = {
+                "rut_ir": self.current_investigator.rut_ir,
+                "q": self.search_value_proy if proy else self.search_value_pub,
+                "orden": self.sort_value_proy if proy else self.sort_value_pub,
+                "desc": int(self.sort_reverse_proy if proy else self.sort_reverse_pub),
+            }
+        else:
+            return
+        params["formato"] = formato
+        query = urllib.parse.urlencode(params, doseq=True)
+        url = f"{rx.config.get_config().api_url}/api/exportar/{tabla}?{query}"
+        # En desarrollo el backend corre en otro origen: la URL es absoluta
+        return rx.download(url=rx.Var.create(url))
+
+    @rx.event(background=True)
+    async def apply_typed_search(self, name: str, seq: int):
+        await asyncio.sleep(search_debounce)
+        async with self:
+            # Si llegó otra tecla mientras tanto, esa aplicará su propio texto
+            if self._search_seq.get(name) == seq:
+                setattr(self, name, getattr(self, f"{name}_input"))
+                self._search_applied(name)
+
+    @rx.var
     def current_investigator(self) -> Optional[Investigador]:
-        if not self.id:
+        # Depende solo del id de la ruta y de la versión de los datos
+        if not self.id or not self.dataset_version:
             return None
         try:
             search_id = int(self.id)
         except ValueError:
             return None
-        for inv in self.investigadores:
-            if inv.id == search_id:
-                return inv
-        return None
+        record = self._snapshot().investigadores_por_id.get(search_id)
+        return to_model(Investigador, record) if record else None
 
     def load_investigador(self, id: int | None = None):
         inv = next((x for x in self.investigators if x["id"] == id), None)
         self.current_investigator = inv
 
+    @rx.var
+    def perfil_estatico(self) -> str:
+        """URL absoluta (sin extensión) del perfil exportado por static_export."""
+        return f"{site_url}/perfiles/{self.id}" if self.id else ""
+
     @rx.var
     def current_investigator_is_none(self) -> bool:
         return self.current_investigator is None
 
-    def load_academicas(self):
-        # df = pd.read_csv(academicas_csv, encoding="ISO-8859-1")
-        # df = pd.read_csv(academicas_csv, delimiter="," ,encoding="ISO-8859-1")
-        df = pd.read_excel(academicas_csv)
-        df = df.replace("", None)
-        df["id"] = pd.to_numeric(
-            df["id"], errors="coerce"
-        )
-        df = df.dropna(subset=["id"])  # Elimina filas con NaN en "id"
-        df["id"] = df["id"].astype(int)
-        df["orcid"] = df["orcid"].fillna("")
-        df["grado_mayor"] = df["grado_mayor"].astype(str)
-        # df["grado_mayor"] = df["grado_mayor"].fillna("Investigadora")
-        df["grado_mayor"] = df["grado_mayor"].replace("nan", "INVESTIGADORA")
-        df["grado_mayor"] = df["grado_mayor"].replace("", "INVESTIGADORA")
-        # df["grado_mayor"] = df["grado_mayor"].fillna("")
-        # df["unidad_contrato"] = df["unidad_contrato"].fillna("")
-        df["ocde_2"] = (
-            df["ocde_2"]
-            .astype(str)
-            .apply(lambda x: " ,".join(x.split("#")) if x and x != "nan" else [])
-        )
-        # df["ocde_2"] = df["ocde_2"].astype(str).apply(lambda x: x.split("#") if x and x != "nan" else [])
-
-        # df["ocde_2"] = df["ocde_2"].astype(str).apply(lambda x: ", ".join(x.split("#")) if x and x != "nan" else "")
-
-        # df["ocde_2"] = (
-        #     df["ocde_2"]
-        #     .astype(str)
-        #     .apply(lambda x: [s.strip() for s in x.split("#")] if x and x != "nan" else [])
-        # )
-
-        self.investigadores = [
-            Investigador(**row.to_dict()) for _, row in df.iterrows()
-        ]
-
-        # self.investigadores = [Investigador(**row.to_dict()) for _, row in df.iterrows()]
-        self.total_investigadores = len(self.investigadores)
-
-        self.all_areas = sorted(
-            df["ocde_2"]
-            .dropna()
-            .str.split(",")
-            .explode()
-            .str.strip()
-            .unique()
-            .tolist()
-        )
-
-        # self.all_areas = df["ocde_2"].dropna().unique().tolist()
-        # self.all_areas = df["programa"].dropna().unique().tolist()
+    @rx.event
+    async def load_academicas(self):
+        dataset = await self._load_dataset()
+        self.total_investigadores = len(dataset.investigadores)
+        self.all_areas = list(dataset.all_areas)
 
     # def load_investigador(self, id: int):
     #     # Este método se invocará cuando el usuario visite /investigador/<id>.
@@ -303,149 +475,158 @@ class State(rx.State):
 
     @rx.var
     def total_proyectos(self) -> int:
-        return len(self.proyectos)
+        return len(self._proyectos)
+
+    @rx.var(backend=True)
+    def proyectos_rows(self) -> Sequence[int]:
+        """Posiciones en `_proyectos` que cumplen la búsqueda de la tabla."""
+        if not self.search_value_proy:
+            return range(len(self._proyectos))
+        return self._search_rows(
+            self.search_value_proy,
+            self._proyectos,
+            self._proyectos_inicio,
+            "proyectos_texto",
+            proyecto_search_fields,
+        )
 
-    @rx.var
-    def filtered_sorted_proyectos(self) -> list[Proyectos]:
-        proyectos = self.proyectos
-        if self.search_value_proy:
-            search_value = self.search_value_proy.lower()
-            proyectos = [
-                proyecto
-                for proyecto in proyectos
-                if any(
-                    search_value in str(getattr(proyecto, attr)).lower()
-                    for attr in [
-                        "codigo",
-                        "titulo",
-                        "año",
-                        "disciplina",
-                        "tipo_proyecto",
-                        "investigador_responsable",
-                        "co_investigador",
-                        "unidad",
-                    ]
-                )
+    @rx.var(backend=True)
+    def publicaciones_rows(self) -> Sequence[int]:
+        """Posiciones en `_publicaciones` que cumplen la búsqueda de la tabla."""
+        if not self.search_value_pub:
+            return range(len(self._publicaciones))
+        return self._search_rows(
+            self.search_value_pub,
+            self._publicaciones,
+            self._publicaciones_inicio,
+            "publicaciones_texto",
+            publicacion_search_fields,
+        )
+
+    def _search_rows(self, value, records, start, index_name, fields) -> List[int]:
+        query = value.lower()
+        dataset = self._snapshot()
+        if dataset.version != self.dataset_version:
+            # La instantánea ya no se conserva: se revisan los registros propios
+            return [
+                row
+                for row, record in enumerate(records)
+                if query in TrigramIndex.text(record, fields)
             ]
-        return proyectos
+        index = getattr(dataset, index_name)
+        rows = index.search(query, start, start + len(records))
+        return [row - start for row in rows]
+
+    @rx.var(backend=True)
+    def proyectos_orden(self) -> Sequence[int]:
+        """Permutación de `_proyectos` por la columna y el sentido elegidos."""
+        if self.sort_value_proy not in proyecto_sort_fields:
+            return range(len(self._proyectos))
+        return sort_order(
+            self._proyectos, self.sort_value_proy, self.sort_reverse_proy
+        )
+
+    @rx.var(backend=True)
+    def publicaciones_orden(self) -> Sequence[int]:
+        """Permutación de `_publicaciones` por la columna y el sentido elegidos."""
+        if self.sort_value_pub not in publicacion_sort_fields:
+            return range(len(self._publicaciones))
+        return sort_order(
+            self._publicaciones, self.sort_value_pub, self.sort_reverse_pub
+        )
+
+    @rx.var(backend=True)
+    def proyectos_vista(self) -> Sequence[int]:
+        """Filas de la tabla de proyectos ya filtradas y ordenadas."""
+        return _filter_order(self.proyectos_orden, self.proyectos_rows)
+
+    @rx.var(backend=True)
+    def publicaciones_vista(self) -> Sequence[int]:
+        return _filter_order(self.publicaciones_orden, self.publicaciones_rows)
 
     @rx.var
-    def filtered_sorted_pub(self) -> list[Publicaciones]:
-        publicaciones = self.publicaciones
-        if self.search_value_pub:
-            search_value = self.search_value_pub.lower()
-            publicaciones = [
-                publicacion
-                for publicacion in publicaciones
-                if any(
-                    search_value in str(getattr(publicacion, attr)).lower()
-                    for attr in [
-                        "año",
-                        "titulo",
-                        "revista",
-                        "cuartil",
-                        "autor",
-                        "wos_id",
-                        "liderado",
-                        "url",
-                    ]
-                )
-            ]
-        return publicaciones
+    def total_proy(self) -> int:
+        return len(self.proyectos_rows)
 
     @rx.var
-    def page_number(self) -> int:
-        return (self.offset // self.limit) + 1
+    def total_pub(self) -> int:
+        return len(self.publicaciones_rows)
 
     @rx.var
-    def total_pages(self) -> int:
-        return (self.total_items // self.limit) + (
-            1 if self.total_items % self.limit else 0
-        )
+    def page_number_proy(self) -> int:
+        return (self.offset_proy // self.limit) + 1
+
+    @rx.var
+    def total_pages_proy(self) -> int:
+        return max(1, -(-self.total_proy // self.limit))
+
+    @rx.var
+    def page_number_pub(self) -> int:
+        return (self.offset_pub // self.limit) + 1
+
+    @rx.var
+    def total_pages_pub(self) -> int:
+        return max(1, -(-self.total_pub // self.limit))
 
     @rx.var(initial_value=[])
     def get_current_page(self) -> list[Proyectos]:
-        start_index = self.offset
-        end_index = start_index + self.limit
-        return self.filtered_sorted_proyectos[start_index:end_index]
+        if not (self.offset_proy or self.search_value_proy or self.sort_value_proy):
+            page = self._first_page("proy")
+            if page is not None:
+                return page
+        rows = _page(self.proyectos_vista, self.offset_proy, self.limit)
+        return to_models(Proyectos, [self._proyectos[row] for row in rows])
 
     @rx.var(initial_value=[])
     def get_current_page_pub(self) -> list[Publicaciones]:
-        start_index = self.offset
-        end_index = start_index + self.limit
-        return self.filtered_sorted_pub[start_index:end_index]
-
-    def prev_page(self):
-        if self.page_number > 1:
-            self.offset -= self.limit
-
-    def next_page(self):
-        if self.page_number < self.total_pages:
-            self.offset += self.limit
+        if not (self.offset_pub or self.search_value_pub or self.sort_value_pub):
+            page = self._first_page("pub")
+            if page is not None:
+                return page
+        rows = _page(self.publicaciones_vista, self.offset_pub, self.limit)
+        return to_models(Publicaciones, [self._publicaciones[row] for row in rows])
+
+    def _set_page(self, table: str, page):
+        """Mueve la tabla `table` ("proy" o "pub") a la página `page` (desde 1).
+
+        `page` puede ser una función de la página actual y el total de páginas.
+        """
+        if table not in ("proy", "pub"):
+            return
+        pages = getattr(self, f"total_pages_{table}")
+        if callable(page):
+            page = page(getattr(self, f"page_number_{table}"), pages)
+        page = min(max(page, 1), pages)
+        setattr(self, f"offset_{table}", (page - 1) * self.limit)
 
-    def first_page(self):
-        self.offset = 0
+    def prev_page(self, table: str):
+        self._set_page(table, lambda page, pages: page - 1)
 
-    def last_page(self):
-        self.offset = (self.total_pages - 1) * self.limit
+    def next_page(self, table: str):
+        self._set_page(table, lambda page, pages: page + 1)
 
-    def load_entries(self):
-        if self.current_investigator is None:
-            print(
-                "Error: self.current_investigator es None. No se pueden cargar proyectos."
-            )
-            return
-        # if self.current_investigator is None:
-        #     return
-        df = pd.read_csv(proyectos_csv, encoding="utf-8-sig")
-        df = df.replace("", np.nan)  # Replace empty strings with NaN
-        df.columns = df.columns.str.strip()
-
-        # if isinstance(proyectos_csv, str):
-        #     df = pd.read_csv(proyectos_csv)
-        # else:
-        #     df = proyectos_csv.copy()
-
-        # Verifica que las columnas existan
-        # if "rut_ir" not in df.columns:
-        #     raise ValueError("El DataFrame no contiene la columna 'rut_ir'")
-
-        # rut_actual = str(self.current_investigator.rut_ir).strip()
-        # df["rut_ir"] = df["rut_ir"].astype(str).str.strip()
-        # df = df[df["rut_ir"] == rut_actual].copy()
-
-        df = df[df["rut_ir"] == self.current_investigator.rut_ir]
-        # df["ocde_1"] = df["ocde_1"].fillna("SIN INFO")
-        df["ocde_2"] = df["ocde_2"].fillna("SIN INFO")
-        # df["ocde_1"] = df["ocde_1"].fillna("Sin Info")
-        # df["rol"] = df["rol"].astype(str).str.replace(";", "", regex=False).str.strip()
-        # df["rol"] = df["rol"].replace("", "Sin rol")
-        df["rol"] = df["rol"].fillna("Sin Info")
-        # df["año"] = df["año"].astype(int)
-        df["año"] = pd.to_numeric(
-            df["año"], errors="coerce"
-        )
-        df["año"] = df["año"].fillna(0).astype(int)
-        self.proyectos = [Proyectos(**row) for _, row in df.iterrows()]
-        self.total_items = len(self.proyectos)
-
-    def load_entries_pub(self):
-        if self.current_investigator is None:
-            print(
-                "Error: self.current_investigator es None. No se pueden cargar publicaciones."
-            )
-            return  # Salir de la función si no hay investigador seleccionado
+    def first_page(self, table: str):
+        self._set_page(table, 1)
 
-        df = pd.read_csv(publicaciones_csv, encoding="utf-8-sig")
-        df = df.replace("", np.nan)
-        df = df[df["rut_ir"] == self.current_investigator.rut_ir]
-        df["doi"] = df["doi"].astype(str)
-        df["doi"] = df["doi"].replace("nan", "")
-        self.publicaciones = [Publicaciones(**row) for _, row in df.iterrows()]
+    def last_page(self, table: str):
+        self._set_page(table, lambda page, pages: pages)
 
-    def toggle_sort(self):
-        self.sort_reverse = not self.sort_reverse
-        self.load_entries()
+    def toggle_sort(self, table: str, column: str):
+        """Ordena la tabla por `column`; un segundo clic invierte el sentido."""
+        if table == "proy" and column in proyecto_sort_fields:
+            if self.sort_value_proy == column:
+                self.sort_reverse_proy = not self.sort_reverse_proy
+            else:
+                self.sort_value_proy = column
+                self.sort_reverse_proy = False
+            self.offset_proy = 0
+        elif table == "pub" and column in publicacion_sort_fields:
+            if self.sort_value_pub == column:
+                self.sort_reverse_pub = not self.sort_reverse_pub
+            else:
+                self.sort_value_pub = column
+                self.sort_reverse_pub = False
+            self.offset_pub = 0
 
     def add_selected(self, list_name: str, item: str):
         self.selected_items[list_name].append(item)
@@ -454,17 +635,18 @@ class State(rx.State):
         self.selected_items[list_name].remove(item)
 
     def add_all_selected(self, list_name: str):
-        self.selected_items[list_name] = list(all_items[list_name])
+        self.selected_items[list_name] = self.stats_items.get(list_name, [])
 
     def clear_selected(self, list_name: str):
         self.selected_items[list_name].clear()
 
-    def random_selected(self, list_name: str):
-        self.selected_items[list_name] = np.random.choice(
-            all_items[list_name],
-            size=np.random.randint(1, len(all_items[list_name]) + 1),
-            replace=False,
-        ).tolist()
+    @rx.var
+    def stats_items(self) -> dict[str, list[str]]:
+        """Valores de cada filtro de estadísticas presentes en los datos."""
+        if not self.dataset_version:
+            return {key: [] for key in filter_dimensions}
+        cube = self._snapshot().estadisticas
+        return {key: cube.values(dim) for key, dim in filter_dimensions.items()}
 
     @rx.event
     def toggle_filter(self, filter_key: str, value: str):
@@ -591,6 +773,7 @@ class State(rx.State):
             self._perform_simple_ai_search()
         finally:
             self.ai_search_loading = False
+            self._apply_search("search_term", self.search_term)
 
     def _perform_simple_ai_search(self):
         """Fallback simple search when AI is not available."""
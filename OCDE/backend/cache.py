@@ -0,0 +1,85 @@
+"""
+Caché compartida (entre sesiones) de resultados de filtros.
+
+Muchas visitas repiten las mismas búsquedas y combinaciones de áreas en
+/investigadoras; el resultado se guarda una sola vez por proceso como las
+posiciones de las investigadoras dentro de la instantánea. La versión de la
+instantánea es parte de la clave, y al publicarse una versión nueva se
+descartan las entradas de las anteriores.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Tuple
+
+from .indexes import tokens
+
+# Cantidad máxima de combinaciones guardadas
+filter_cache_size = int(os.getenv("OCDE_FILTER_CACHE_SIZE", "256"))
+
+FilterKey = Tuple[int, str, Tuple[str, ...]]
+
+
+class FilterCache:
+    """LRU acotada de filtros → posiciones, con contadores de aciertos."""
+
+    def __init__(self, maxsize: int = filter_cache_size):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._version = 0
+        self._entries: "OrderedDict[FilterKey, Tuple[int, ...]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(version: int, term: str, areas: Iterable[str]) -> FilterKey:
+        """Clave normalizada: mismas palabras plegadas y mismas áreas sin orden."""
+        return version, " ".join(tokens(term)), tuple(sorted(set(areas)))
+
+    def get(
+        self,
+        version: int,
+        term: str,
+        areas: Iterable[str],
+        compute: Callable[[], Iterable[int]],
+    ) -> Tuple[int, ...]:
+        """Resultado guardado para el filtro, o el de `compute()` si no está."""
+        key = self.key(version, term, areas)
+        with self._lock:
+            if version > self._version:
+                # Instantánea nueva: lo guardado ya no sirve
+                self._entries.clear()
+                self._version = version
+            rows = self._entries.get(key)
+            if rows is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return rows
+            self.misses += 1
+        rows = tuple(int(row) for row in compute())
+        with self._lock:
+            # Las sesiones que aún ven una versión anterior no la guardan
+            if version == self._version:
+                self._entries[key] = rows
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return rows
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "version": self._version,
+                "entries": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+filter_cache = FilterCache()
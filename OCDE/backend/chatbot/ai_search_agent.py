@@ -57,45 +57,21 @@ class AgnoSearchAgent:
     def _load_data(self):
         """Carga y procesa datos de investigadores, publicaciones y proyectos."""
         try:
-            # Cargar datos de investigadores
             academicas_file = os.path.join(self.data_directory, "academicas.xlsx")
-            publicaciones_file = os.path.join(
-                self.data_directory, "publicaciones___.csv"
-            )
-            proyectos_file = os.path.join(
-                self.data_directory, "proyectos_total_ocde1_.csv"
-            )
 
             if not os.path.exists(academicas_file):
                 logger.error(f"Archivo {academicas_file} no encontrado")
                 return
 
-            # Procesar investigadores
-            df_academicas = pd.read_excel(academicas_file)
-            df_academicas = df_academicas.replace("", None)
-            df_academicas["id"] = pd.to_numeric(df_academicas["id"], errors="coerce")
-            df_academicas = df_academicas.dropna(subset=["id"])
-            df_academicas["id"] = df_academicas["id"].astype(int)
-            df_academicas["orcid"] = df_academicas["orcid"].fillna("")
-            df_academicas["grado_mayor"] = (
-                df_academicas["grado_mayor"].astype(str).replace("nan", "INVESTIGADORA")
-            )
-            df_academicas["ocde_2"] = (
-                df_academicas["ocde_2"]
-                .astype(str)
-                .apply(lambda x: ", ".join(x.split("#")) if x and x != "nan" else "")
-            )
-
-            publicaciones_data = []
-            proyectos_data = []
+            # Los datos ya normalizados vienen del registro compartido
+            from ..dataset import get_dataset
 
-            if os.path.exists(publicaciones_file):
-                df_pub = pd.read_csv(publicaciones_file, encoding="utf-8-sig")
-                publicaciones_data = df_pub.to_dict("records")
+            dataset = get_dataset()
+            df_academicas = pd.DataFrame(dataset.investigadores)
+            df_academicas["ocde_2"] = df_academicas["ocde_2"].str.replace(" ,", ", ")
 
-            if os.path.exists(proyectos_file):
-                df_proy = pd.read_csv(proyectos_file, encoding="utf-8-sig")
-                proyectos_data = df_proy.to_dict("records")
+            publicaciones_data = [p._asdict() for p in dataset.publicaciones]
+            proyectos_data = [p._asdict() for p in dataset.proyectos]
 
             self._create_investigators_summary_extended(
                 df_academicas, publicaciones_data, proyectos_data
@@ -0,0 +1,86 @@
+"""
+Caché columnar (Parquet) de las fuentes de datos.
+
+La primera carga de cada archivo de origen guarda el resultado ya normalizado
+en un Parquet tipado cuyo nombre incluye el hash del archivo y de las columnas
+pedidas; las cargas siguientes leen solo esas columnas desde la caché en vez
+de volver a parsear la planilla o el CSV.
+"""
+
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Callable, Iterable, Sequence
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Directorio de la caché; en Docker vive en el volumen /app/data
+cache_dir = Path(os.getenv("OCDE_CACHE_DIR", "data/cache"))
+
+# Versión de la normalización. Forma parte del nombre de la caché: debe
+# subirse cada vez que cambie un lector `_read_*` de dataset.py o
+# `_to_columnar`, para no seguir sirviendo Parquet con el formato anterior.
+schema_version = 2
+
+
+def _cache_path(source: str, sha256: str, columns: Sequence[str]) -> Path:
+    columns_key = hashlib.sha1(
+        f"{schema_version}:{','.join(columns)}".encode()
+    ).hexdigest()[:8]
+    return cache_dir / f"{Path(source).stem}-{sha256[:16]}-{columns_key}.parquet"
+
+
+def _to_columnar(
+    df: pd.DataFrame, columns: Sequence[str], required: Iterable[str]
+) -> pd.DataFrame:
+    """Deja solo `columns` con tipos que Parquet puede guardar sin ambigüedad.
+
+    Las columnas de texto quedan como `str` o nulas; en las obligatorias para
+    el modelo el nulo se reemplaza por cadena vacía.
+    """
+    required = set(required)
+    df = df[[col for col in columns if col in df.columns]].copy()
+    for col in df.columns:
+        if df[col].dtype != object:
+            continue
+        empty = "" if col in required else None
+        df[col] = [empty if pd.isna(v) else str(v) for v in df[col]]
+    return df
+
+
+def read_columnar(
+    source: str,
+    sha256: str,
+    reader: Callable[[str], pd.DataFrame],
+    columns: Sequence[str],
+    required: Iterable[str] = (),
+) -> pd.DataFrame:
+    """Lee `source` desde la caché, o la construye con `reader` si no existe."""
+    target = _cache_path(source, sha256, columns)
+    if target.exists():
+        try:
+            return pd.read_parquet(target)
+        except Exception as e:
+            logger.warning(f"Caché {target} ilegible, se reconstruye: {e}")
+
+    start = time.perf_counter()
+    df = _to_columnar(reader(source), columns, required)
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(f".{os.getpid()}.tmp")
+        df.to_parquet(tmp, index=False)
+        os.replace(tmp, target)
+        for old in cache_dir.glob(f"{Path(source).stem}-*.parquet"):
+            if old != target:
+                old.unlink(missing_ok=True)
+        logger.info(
+            f"Caché {target.name} creada en {time.perf_counter() - start:.2f}s"
+        )
+    except Exception as e:
+        # Sin caché la aplicación sigue funcionando, solo arranca más lento
+        logger.warning(f"No se pudo escribir la caché {target}: {e}")
+    return df
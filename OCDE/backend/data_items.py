@@ -13,8 +13,6 @@ años_dict: Dict[str, LiteralAccentColor] = {
     "2025": "ruby",
 }
 
-años_list = list(años_dict.keys())
-
 # Disciplinas
 disciplinas_dict: Dict[str, LiteralAccentColor] = {
     "Ciencias Agrícolas": "green",
@@ -25,8 +23,6 @@ disciplinas_dict: Dict[str, LiteralAccentColor] = {
     "Medicina y Ciencias de la Salud": "gold",
 }   
 
-disciplinas_list = list(disciplinas_dict.keys())
-
 # Unidades
 unidades_dict: Dict[str, LiteralAccentColor] = {
     "DADI": "green",
@@ -41,10 +37,17 @@ unidades_dict: Dict[str, LiteralAccentColor] = {
     "VRIP": "black",
 }
 
-unidades_list = list(unidades_dict.keys())
+# Tipos de proyecto
+tipos_dict: Dict[str, LiteralAccentColor] = {
+    "ANID": "blue",
+    "FONDECYT": "purple",
+    "DIUFRO": "green",
+}
 
-all_items = {
-    "años": años_list,
-    "disciplinas": disciplinas_list,
-    "unidades": unidades_list
-}
\ No newline at end of file
+# Cuartiles de las revistas
+cuartiles_dict: Dict[str, LiteralAccentColor] = {
+    "Q1": "green",
+    "Q2": "blue",
+    "Q3": "orange",
+    "Q4": "red",
+}
@@ -0,0 +1,520 @@
+"""
+Registro de datos compartido por todo el proceso.
+
+Las fuentes (académicas, proyectos y publicaciones) se leen y normalizan una
+sola vez; cada sesión y cada evento reciben la misma instantánea inmutable y
+versionada en lugar de volver a parsear los archivos.
+
+`watch_data_files` vigila los archivos de origen y, cuando cambian, construye
+una nueva instantánea en segundo plano y la publica con un intercambio
+atómico: los eventos en curso siguen leyendo la instantánea anterior.
+
+Con base de datos (`DB_URL`), los archivos siguen siendo la fuente: si están
+presentes, cada cambio se ingresa de forma incremental a las tablas antes de
+construir la instantánea desde ellas. Se vigilan tanto los archivos como la
+base de datos, que también puede actualizarse con `python -m OCDE.backend.ingest`.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from . import store
+from .cache import filter_cache
+from .columnar import cache_dir, read_columnar
+from .locks import file_lock
+from .indexes import AreaIndex, BM25Index, RowRanges, TokenIndex, TrigramIndex
+from .models import Investigador, Proyectos, Publicaciones
+from .profiles import ProfileBundle, build_profiles
+from .stats import StatsCube, build_cube, build_gender_cube
+from .records import (
+    InvestigadorRecord,
+    ProyectoRecord,
+    PublicacionRecord,
+    build_records,
+    investigador_columns,
+    proyecto_columns,
+    proyecto_search_fields,
+    publicacion_columns,
+    publicacion_search_fields,
+)
+
+logger = logging.getLogger(__name__)
+
+
+proyectos_csv = "proyectos_total_ocde1_.csv"
+
+# academicas_csv = "academicas_clean.csv"
+academicas_csv = "academicas.xlsx"
+
+publicaciones_csv = "publicaciones___.csv"
+
+
+def _required(model) -> list[str]:
+    return [name for name, field in model.__fields__.items() if field.required]
+
+
+# Segundos entre revisiones de los archivos de origen
+watch_interval = float(os.getenv("OCDE_DATA_WATCH_INTERVAL", "5"))
+
+
+class SourceStamp(NamedTuple):
+    """Huella de un archivo de origen al momento de leerlo."""
+
+    mtime_ns: int
+    size: int
+    sha256: str
+
+
+def _stat(path: str) -> Tuple[int, int]:
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stamp(path: str) -> SourceStamp:
+    mtime_ns, size = _stat(path)
+    return SourceStamp(mtime_ns, size, _sha256(path))
+
+
+def _read_academicas(path: str) -> pd.DataFrame:
+    """Lee y normaliza la planilla de académicas."""
+    df = pd.read_excel(path)
+    df = df.replace("", None)
+    df["id"] = pd.to_numeric(df["id"], errors="coerce")
+    df = df.dropna(subset=["id"])  # Elimina filas con NaN en "id"
+    df["id"] = df["id"].astype(int)
+    df["orcid"] = df["orcid"].fillna("")
+    df["grado_mayor"] = df["grado_mayor"].astype(str)
+    df["grado_mayor"] = df["grado_mayor"].replace("nan", "INVESTIGADORA")
+    df["grado_mayor"] = df["grado_mayor"].replace("", "INVESTIGADORA")
+    df["ocde_2"] = (
+        df["ocde_2"]
+        .astype(str)
+        .apply(lambda x: " ,".join(x.split("#")) if x and x != "nan" else "")
+    )
+    return df.reset_index(drop=True)
+
+
+def _read_proyectos(path: str) -> pd.DataFrame:
+    """Lee y normaliza el CSV de proyectos."""
+    df = pd.read_csv(path, encoding="utf-8-sig")
+    df = df.replace("", np.nan)  # Replace empty strings with NaN
+    df.columns = df.columns.str.strip()
+    df["ocde_2"] = df["ocde_2"].fillna("SIN INFO")
+    df["rol"] = df["rol"].fillna("Sin Info")
+    df["año"] = pd.to_numeric(df["año"], errors="coerce")
+    df["año"] = df["año"].fillna(0).astype(int)
+    return df.reset_index(drop=True)
+
+
+def _read_publicaciones(path: str) -> pd.DataFrame:
+    """Lee y normaliza el CSV de publicaciones."""
+    df = pd.read_csv(path, encoding="utf-8-sig")
+    df = df.replace("", np.nan)
+    df["año"] = pd.to_numeric(df["año"], errors="coerce")
+    df["año"] = df["año"].fillna(0).astype(int)
+    df["doi"] = df["doi"].astype(str)
+    df["doi"] = df["doi"].replace("nan", "")
+    return df.reset_index(drop=True)
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """Instantánea inmutable de los datos del observatorio.
+
+    Solo guarda registros inmutables e índices; los DataFrames de la carga se
+    descartan al terminar de construirla.
+    """
+
+    version: int
+    loaded_at: float
+    build_seconds: float
+    sources: Dict[str, SourceStamp]
+    investigadores: Tuple[InvestigadorRecord, ...]
+    investigadores_por_id: Dict[int, InvestigadorRecord]
+    investigadores_por_rut: Dict[str, InvestigadorRecord]
+    proyectos: Tuple[ProyectoRecord, ...]
+    publicaciones: Tuple[PublicacionRecord, ...]
+    all_areas: Tuple[str, ...]
+    areas: AreaIndex
+    busqueda: TokenIndex
+    proyectos_por_rut: RowRanges
+    publicaciones_por_rut: RowRanges
+    proyectos_texto: TrigramIndex
+    publicaciones_texto: TrigramIndex
+    # Proyectos seguidos de publicaciones, para la búsqueda global
+    corpus: BM25Index
+    # Resumen del perfil de cada investigadora, por id
+    perfiles: Dict[int, ProfileBundle]
+    # Cubo de indicadores para la página de estadísticas
+    estadisticas: StatsCube
+    # Publicaciones lideradas por mujeres, para los indicadores de género
+    genero: StatsCube
+
+    def fingerprint(self) -> str:
+        """Huella del contenido de las fuentes; a diferencia de `version`, no
+        cambia al reiniciar el proceso si los archivos son los mismos."""
+        digest = hashlib.sha256()
+        for path in sorted(self.sources):
+            digest.update(self.sources[path].sha256.encode())
+        return digest.hexdigest()[:16]
+
+    def buscar(self, query: str, k: int = 20) -> List[Tuple[tuple, float]]:
+        """Proyectos y publicaciones más relevantes para `query` (BM25)."""
+        n_proyectos = len(self.proyectos)
+        return [
+            (
+                self.proyectos[row]
+                if row < n_proyectos
+                else self.publicaciones[row - n_proyectos],
+                score,
+            )
+            for row, score in self.corpus.top(query, k)
+        ]
+
+    def filtrar(self, term: str, areas: List[str]) -> np.ndarray:
+        """Posiciones de las investigadoras que cumplen la búsqueda y las áreas."""
+        mask = self.areas.everything
+        if areas:
+            mask &= self.areas.match_all(areas)
+        if term.strip():
+            mask &= self.busqueda.match(term)
+        return self.areas.rows(mask)
+
+    def proyectos_records(self, rut_ir: str) -> Tuple[ProyectoRecord, ...]:
+        """Registros de los proyectos de un rut_ir."""
+        return self.proyectos[self.proyectos_por_rut.rows(rut_ir)]
+
+    def publicaciones_records(self, rut_ir: str) -> Tuple[PublicacionRecord, ...]:
+        """Registros de las publicaciones de un rut_ir."""
+        return self.publicaciones[self.publicaciones_por_rut.rows(rut_ir)]
+
+    def buscar_proyectos(self, rut_ir: str, query: str) -> List[int]:
+        """Posiciones en `proyectos_records(rut_ir)` cuyo texto contiene `query`."""
+        rows = self.proyectos_por_rut.rows(rut_ir)
+        hits = self.proyectos_texto.search(query.lower(), rows.start, rows.stop)
+        return [row - rows.start for row in hits]
+
+    def buscar_publicaciones(self, rut_ir: str, query: str) -> List[int]:
+        """Posiciones en `publicaciones_records(rut_ir)` cuyo texto contiene `query`."""
+        rows = self.publicaciones_por_rut.rows(rut_ir)
+        hits = self.publicaciones_texto.search(query.lower(), rows.start, rows.stop)
+        return [row - rows.start for row in hits]
+
+
+def read_source_files(
+    academicas: str = academicas_csv,
+    proyectos: str = proyectos_csv,
+    publicaciones: str = publicaciones_csv,
+) -> Tuple[Dict[str, SourceStamp], pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Huellas y DataFrames normalizados de los archivos (o de su caché)."""
+    # La huella se toma antes de leer: si el origen cambia durante la
+    # lectura, la siguiente revisión lo detecta y vuelve a cargar.
+    sources = {path: _stamp(path) for path in (academicas, proyectos, publicaciones)}
+    df_academicas = read_columnar(
+        academicas,
+        sources[academicas].sha256,
+        _read_academicas,
+        investigador_columns,
+        _required(Investigador),
+    )
+    df_proyectos = read_columnar(
+        proyectos,
+        sources[proyectos].sha256,
+        _read_proyectos,
+        proyecto_columns,
+        _required(Proyectos),
+    )
+    df_publicaciones = read_columnar(
+        publicaciones,
+        sources[publicaciones].sha256,
+        _read_publicaciones,
+        publicacion_columns,
+        _required(Publicaciones),
+    )
+    return sources, df_academicas, df_proyectos, df_publicaciones
+
+
+# Huellas de los archivos de origen que este proceso ya ingresó a la base de
+# datos
+_ingested: Dict[str, str] = {}
+
+
+def _sync_store() -> Dict[str, SourceStamp]:
+    """Ingresa a la base de datos los archivos de origen si cambiaron."""
+    # ingest importa este módulo
+    from .ingest import ingest_frames
+
+    paths = (academicas_csv, proyectos_csv, publicaciones_csv)
+    sources = {path: _stamp(path) for path in paths}
+    if {path: stamp.sha256 for path, stamp in sources.items()} == _ingested:
+        return sources
+    db_path = store.sqlite_path()
+    lock = f"{db_path}.lock" if db_path else os.path.join(cache_dir, "ingest.lock")
+    # Varios workers pueden arrancar a la vez: la ingesta es incremental, el
+    # segundo en tomar el bloqueo no encuentra cambios
+    with file_lock(lock):
+        sources, *frames = read_source_files()
+        ingest_frames(*frames)
+    _ingested.clear()
+    _ingested.update({path: stamp.sha256 for path, stamp in sources.items()})
+    return sources
+
+
+def _load_frames():
+    """Huellas de origen y DataFrames, desde la base de datos si existe."""
+    if store.enabled():
+        try:
+            sources = {}
+            if all(
+                os.path.exists(p)
+                for p in (academicas_csv, proyectos_csv, publicaciones_csv)
+            ):
+                sources = _sync_store()
+            path = store.sqlite_path()
+            if path:
+                sources[path] = _stamp(path)
+            return sources, *store.read_frames()
+        except Exception as e:
+            logger.warning(f"Base de datos no disponible, se leen los archivos: {e}")
+    return read_source_files()
+
+
+def build_dataset(version: int) -> Dataset:
+    """Construye una nueva instantánea desde la base de datos o los archivos."""
+    start = time.perf_counter()
+
+    sources, df_academicas, df_proyectos, df_publicaciones = _load_frames()
+
+    # Ordenar por rut_ir deja las filas de cada investigadora contiguas
+    df_proyectos, proyectos_por_rut = RowRanges.build(df_proyectos, "rut_ir")
+    df_publicaciones, publicaciones_por_rut = RowRanges.build(
+        df_publicaciones, "rut_ir"
+    )
+
+    investigadores = build_records(df_academicas, InvestigadorRecord)
+    all_areas = tuple(
+        sorted(
+            area
+            for area in df_academicas["ocde_2"]
+            .dropna()
+            .str.split(",")
+            .explode()
+            .str.strip()
+            .unique()
+            .tolist()
+            if area
+        )
+    )
+
+    proyectos = build_records(df_proyectos, ProyectoRecord)
+    publicaciones = build_records(df_publicaciones, PublicacionRecord)
+    areas = AreaIndex(
+        [
+            [area.strip() for area in (inv.ocde_2 or "").split(",") if area.strip()]
+            for inv in investigadores
+        ]
+    )
+    busqueda = TokenIndex(
+        [f"{inv.id} {inv.name} {inv.ocde_2 or ''}" for inv in investigadores]
+    )
+    proyectos_texto = TrigramIndex.from_records(proyectos, proyecto_search_fields)
+    publicaciones_texto = TrigramIndex.from_records(
+        publicaciones, publicacion_search_fields
+    )
+    corpus = BM25Index(
+        [
+            f"{p.titulo} {p.disciplina or ''} {p.investigador_responsable}"
+            for p in proyectos
+        ]
+        + [
+            f"{p.titulo} {p.revista} {p.autor} {p.disciplina or ''}"
+            for p in publicaciones
+        ]
+    )
+    perfiles = build_profiles(
+        investigadores,
+        proyectos,
+        proyectos_por_rut,
+        publicaciones,
+        publicaciones_por_rut,
+    )
+
+    dataset = Dataset(
+        version=version,
+        loaded_at=time.time(),
+        build_seconds=time.perf_counter() - start,
+        sources=sources,
+        investigadores=investigadores,
+        investigadores_por_id={inv.id: inv for inv in investigadores},
+        investigadores_por_rut={inv.rut_ir: inv for inv in investigadores},
+        proyectos=proyectos,
+        publicaciones=publicaciones,
+        all_areas=all_areas,
+        areas=areas,
+        busqueda=busqueda,
+        proyectos_por_rut=proyectos_por_rut,
+        publicaciones_por_rut=publicaciones_por_rut,
+        proyectos_texto=proyectos_texto,
+        publicaciones_texto=publicaciones_texto,
+        corpus=corpus,
+        perfiles=perfiles,
+        estadisticas=build_cube(df_academicas, df_proyectos, df_publicaciones),
+        genero=build_gender_cube(df_academicas, df_publicaciones),
+    )
+    logger.info(
+        f"Dataset v{version} cargado en {dataset.build_seconds:.2f}s: "
+        f"{len(df_academicas)} investigadoras, {len(df_proyectos)} proyectos, "
+        f"{len(df_publicaciones)} publicaciones"
+    )
+    return dataset
+
+
+_lock = threading.Lock()
+_current: Optional[Dataset] = None
+
+# La instantánea vigente y la anterior, para que las sesiones que cargaron
+# datos justo antes de una recarga sigan resolviendo con la misma versión
+_recent: Dict[int, Dataset] = {}
+
+
+def get_dataset() -> Dataset:
+    """Devuelve la instantánea vigente, cargándola la primera vez."""
+    global _current
+    dataset = _current
+    if dataset is None:
+        with _lock:
+            if _current is None:
+                _current = build_dataset(version=1)
+                _recent[_current.version] = _current
+            dataset = _current
+    return dataset
+
+
+async def get_dataset_async() -> Dataset:
+    """`get_dataset` para el bucle de eventos.
+
+    Solo la primera carga construye la instantánea (las recargas se publican
+    ya construidas): únicamente entonces se espera en un hilo.
+    """
+    dataset = _current
+    if dataset is None:
+        dataset = await asyncio.to_thread(get_dataset)
+    return dataset
+
+
+def dataset_for(version: int) -> Dataset:
+    """La instantánea `version` si aún se conserva; si no, la vigente."""
+    dataset = _recent.get(version)
+    return dataset if dataset is not None else get_dataset()
+
+
+_reload_lock = threading.Lock()
+
+# Último (mtime, tamaño) observado por archivo, para esperar a que una
+# copia en curso termine antes de recargar
+_last_seen: Dict[str, Tuple[int, int]] = {}
+
+# (mtime, tamaño) ya verificados por hash como idénticos a la instantánea
+_verified: Dict[str, Tuple[int, int]] = {}
+
+
+def _changed_sources(dataset: Dataset) -> list[str]:
+    """Archivos cuyo contenido difiere del de la instantánea."""
+    changed = []
+    for path, stamp in dataset.sources.items():
+        try:
+            current = _stat(path)
+        except FileNotFoundError:
+            # Reemplazo en curso: se revisa en la próxima vuelta
+            continue
+        settled = _last_seen.get(path) == current
+        _last_seen[path] = current
+        if current == (stamp.mtime_ns, stamp.size) or not settled:
+            continue
+        if _verified.get(path) == current:
+            continue
+        if _sha256(path) != stamp.sha256:
+            changed.append(path)
+        else:
+            _verified[path] = current
+    return changed
+
+
+def reload_dataset() -> Dataset:
+    """Construye una nueva instantánea y la publica de forma atómica."""
+    global _current
+    with _reload_lock:
+        previous = get_dataset()
+        dataset = build_dataset(version=previous.version + 1)
+        with _lock:
+            _current = dataset
+            _recent.clear()
+            _recent.update({previous.version: previous, dataset.version: dataset})
+        filter_cache.clear()
+        logger.info(
+            f"Dataset v{previous.version} -> v{dataset.version} publicado "
+            f"(reconstrucción {dataset.build_seconds:.2f}s)"
+        )
+    return dataset
+
+
+def reload_if_changed() -> Optional[Dataset]:
+    """Recarga los datos si algún archivo de origen cambió."""
+    changed = _changed_sources(get_dataset())
+    if not changed:
+        return None
+    logger.info(f"Cambios detectados en {', '.join(changed)}; reconstruyendo")
+    return reload_dataset()
+
+
+def dataset_info() -> Dict[str, Any]:
+    """Estado de la instantánea vigente, para operadores."""
+    dataset = get_dataset()
+    return {
+        "version": dataset.version,
+        "fingerprint": dataset.fingerprint(),
+        "loaded_at": dataset.loaded_at,
+        "build_seconds": round(dataset.build_seconds, 3),
+        "sources": {
+            path: {"size": stamp.size, "sha256": stamp.sha256}
+            for path, stamp in dataset.sources.items()
+        },
+        "investigadoras": len(dataset.investigadores),
+        "proyectos": len(dataset.proyectos),
+        "publicaciones": len(dataset.publicaciones),
+        "filter_cache": filter_cache.stats(),
+    }
+
+
+async def watch_data_files():
+    """Tarea de ciclo de vida que recarga los datos cuando cambian los archivos."""
+    while True:
+        try:
+            # Si la primera carga falla (un archivo ausente o a medio
+            # escribir) se reintenta igual que una recarga: la tarea no se
+            # vuelve a crear si termina
+            if _current is None:
+                await asyncio.to_thread(get_dataset)
+            else:
+                await asyncio.to_thread(reload_if_changed)
+        except Exception as e:
+            # Se mantiene la instantánea anterior y se reintenta luego
+            logger.error(f"Error recargando datos: {e}")
+        await asyncio.sleep(watch_interval)
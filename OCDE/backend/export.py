@@ -0,0 +1,142 @@
+"""
+Exportación en streaming de los resultados filtrados (CSV, XLSX o JSON).
+
+Cada formato es un generador que produce el archivo por bloques de
+`chunk_size` filas: la respuesta empieza a enviarse de inmediato y nunca se
+arma el archivo completo en memoria. El XLSX es un ZIP que solo se puede
+cerrar al final, así que se escribe con el modo `write_only` de openpyxl a un
+archivo temporal en disco y se envía desde ahí en bloques.
+"""
+
+import csv
+import io
+import json
+import math
+import tempfile
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from openpyxl import Workbook
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+
+from .cache import filter_cache
+from .dataset import Dataset
+from .records import private_fields, sort_order
+
+# Filas que se serializan antes de entregar cada bloque
+chunk_size = 500
+
+# Bytes por bloque al enviar el XLSX desde el archivo temporal
+file_chunk_size = 64 * 1024
+
+media_types = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "json": "application/json",
+}
+
+
+def columns(record_type) -> List[str]:
+    """Campos de un tipo de registro que se pueden publicar."""
+    return [f for f in record_type._fields if f not in private_fields]
+
+
+def investigadoras(dataset: Dataset, term: str, areas: List[str]) -> Iterator[tuple]:
+    """Investigadoras que cumplen el filtro del directorio, en su orden."""
+    rows = filter_cache.get(
+        dataset.version, term, areas, lambda: dataset.filtrar(term, areas)
+    )
+    return (dataset.investigadores[row] for row in rows)
+
+
+def tabla(
+    records: Sequence[tuple],
+    rows: Optional[Sequence[int]],
+    sort: str,
+    reverse: bool,
+) -> Iterator[tuple]:
+    """Registros de una tabla del perfil como se ven en pantalla.
+
+    `rows` son las posiciones que cumplen la búsqueda (`None` si no hay
+    búsqueda) y `sort` la columna elegida (vacía para el orden original).
+    """
+    order = sort_order(records, sort, reverse) if sort else range(len(records))
+    if rows is not None:
+        keep = set(rows)
+        order = [row for row in order if row in keep]
+    return (records[row] for row in order)
+
+
+def _value(value):
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return None
+    return value
+
+
+def _chunks(records: Iterable[tuple]) -> Iterator[List[tuple]]:
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _csv(records: Iterable[tuple], fields: List[str]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # BOM para que Excel reconozca UTF-8 (tildes y eñes)
+    buffer.write("\ufeff")
+    writer.writerow(fields)
+    for chunk in _chunks(records):
+        for record in chunk:
+            writer.writerow(
+                ["" if (v := _value(getattr(record, f))) is None else v for f in fields]
+            )
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def _json(records: Iterable[tuple], fields: List[str]) -> Iterator[bytes]:
+    yield b"["
+    separator = ""
+    for chunk in _chunks(records):
+        parts = []
+        for record in chunk:
+            item = {f: _value(getattr(record, f)) for f in fields}
+            parts.append(separator + json.dumps(item, ensure_ascii=False, default=str))
+            separator = ","
+        yield "".join(parts).encode()
+    yield b"]"
+
+
+def _cell(value):
+    value = _value(value)
+    if isinstance(value, str):
+        return ILLEGAL_CHARACTERS_RE.sub("", value)
+    return value
+
+
+def _xlsx(records: Iterable[tuple], fields: List[str]) -> Iterator[bytes]:
+    with tempfile.TemporaryFile() as tmp:
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet("Datos")
+        sheet.append(fields)
+        for record in records:
+            sheet.append([_cell(getattr(record, f)) for f in fields])
+        workbook.save(tmp)
+        tmp.seek(0)
+        while block := tmp.read(file_chunk_size):
+            yield block
+
+
+_writers = {"csv": _csv, "xlsx": _xlsx, "json": _json}
+
+
+def stream(records: Iterable[tuple], fields: List[str], formato: str) -> Iterator[bytes]:
+    """Generador con el contenido del archivo en el formato pedido."""
+    return _writers[formato](records, fields)
@@ -0,0 +1,257 @@
+"""
+Índices en memoria que se construyen junto con cada instantánea de datos.
+"""
+
+import bisect
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class RowRanges:
+    """Índice clave → rango contiguo de filas de un DataFrame ordenado por clave.
+
+    Obtener las filas de una clave cuesta lo mismo que el número de filas que
+    tiene, sin recorrer el resto de la tabla.
+    """
+
+    def __init__(self, ranges: Dict[Hashable, Tuple[int, int]]):
+        self._ranges = ranges
+
+    @classmethod
+    def build(cls, df: pd.DataFrame, column: str) -> Tuple[pd.DataFrame, "RowRanges"]:
+        """Ordena `df` por `column` (estable) y construye el índice sobre él."""
+        df = df.sort_values(column, kind="stable", na_position="last")
+        df = df.reset_index(drop=True)
+        keys = df[column].to_numpy()
+        if len(keys) == 0:
+            return df, cls({})
+        starts = np.concatenate(([0], np.flatnonzero(keys[1:] != keys[:-1]) + 1))
+        ends = np.append(starts[1:], len(keys))
+        ranges = {
+            keys[start]: (int(start), int(end))
+            for start, end in zip(starts, ends)
+            if not pd.isna(keys[start])
+        }
+        return df, cls(ranges)
+
+    def rows(self, key: Hashable) -> slice:
+        """Posiciones (para `iloc`) de las filas con esa clave."""
+        start, end = self._ranges.get(key, (0, 0))
+        return slice(start, end)
+
+    def count(self, key: Hashable) -> int:
+        start, end = self._ranges.get(key, (0, 0))
+        return end - start
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._ranges
+
+    def __len__(self) -> int:
+        return len(self._ranges)
+
+
+_token_re = re.compile(r"\w+")
+
+
+def fold(text: str) -> str:
+    """Texto sin tildes ni mayúsculas ("González" → "gonzalez")."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+
+
+def tokens(text: str) -> List[str]:
+    return _token_re.findall(fold(text))
+
+
+class _Bitmaps:
+    """Base de los índices que responden con bitmaps (enteros) sobre filas."""
+
+    size: int
+
+    def _to_bitmap(self, rows: List[int]) -> int:
+        bits = np.zeros(self.size, dtype=bool)
+        bits[rows] = True
+        return int.from_bytes(np.packbits(bits, bitorder="little").tobytes(), "little")
+
+    @property
+    def everything(self) -> int:
+        return (1 << self.size) - 1
+
+    def rows(self, mask: int) -> np.ndarray:
+        """Posiciones de los bits encendidos, en orden ascendente."""
+        if not mask:
+            return np.empty(0, dtype=np.int64)
+        raw = np.frombuffer(mask.to_bytes((self.size + 7) // 8, "little"), np.uint8)
+        return np.flatnonzero(np.unpackbits(raw, bitorder="little")[: self.size])
+
+
+class AreaIndex(_Bitmaps):
+    """Áreas OCDE internadas a enteros, con un bitmap de filas por área.
+
+    El bit `i` del bitmap de un área indica que la fila `i` la tiene; filtrar
+    por varias áreas a la vez es la intersección (AND) de sus bitmaps.
+    """
+
+    def __init__(self, area_lists: Sequence[Iterable[str]]):
+        self.size = len(area_lists)
+        self.ids: Dict[str, int] = {}
+        positions: List[List[int]] = []
+        for row, areas in enumerate(area_lists):
+            for area in areas:
+                area_id = self.ids.setdefault(area, len(self.ids))
+                if area_id == len(positions):
+                    positions.append([])
+                positions[area_id].append(row)
+        self._bitmaps = [self._to_bitmap(rows) for rows in positions]
+
+    def bitmap(self, area: str) -> int:
+        area_id = self.ids.get(area)
+        return 0 if area_id is None else self._bitmaps[area_id]
+
+    def match_all(self, areas: Iterable[str]) -> int:
+        """Bitmap de las filas que tienen todas las áreas pedidas."""
+        mask = self.everything
+        for area in areas:
+            mask &= self.bitmap(area)
+            if not mask:
+                break
+        return mask
+
+
+class TokenIndex(_Bitmaps):
+    """Índice invertido token → bitmap de filas, con tildes y mayúsculas plegadas.
+
+    Cada palabra de la consulta se trata como prefijo de un token: "gonz cien"
+    encuentra "González" con área "Ciencias ...". Los tokens se guardan
+    ordenados, de modo que los que comparten un prefijo quedan contiguos.
+    """
+
+    def __init__(self, docs: Sequence[str]):
+        self.size = len(docs)
+        postings: Dict[str, List[int]] = {}
+        for row, doc in enumerate(docs):
+            for token in set(tokens(doc)):
+                postings.setdefault(token, []).append(row)
+        self._tokens = sorted(postings)
+        self._bitmaps = [self._to_bitmap(postings[token]) for token in self._tokens]
+
+    def prefix(self, prefix: str) -> int:
+        """Bitmap de las filas con algún token que empieza por `prefix` (ya plegado)."""
+        start = bisect.bisect_left(self._tokens, prefix)
+        end = bisect.bisect_left(self._tokens, prefix + "\U0010ffff", lo=start)
+        mask = 0
+        for bitmap in self._bitmaps[start:end]:
+            mask |= bitmap
+        return mask
+
+    def match(self, query: str) -> int:
+        """Bitmap de las filas que contienen todas las palabras de `query` como prefijo."""
+        mask = self.everything
+        for prefix in tokens(query):
+            mask &= self.prefix(prefix)
+            if not mask:
+                break
+        return mask
+
+
+class TrigramIndex:
+    """Índice de trigramas para búsquedas por subcadena arbitraria.
+
+    Cada fila se indexa por el texto en minúsculas de sus campos, separados
+    por un carácter que no se puede escribir en el buscador. Una consulta solo
+    revisa las filas que contienen todos sus trigramas, y el resultado se
+    confirma con `in`, por lo que es idéntico a recorrer todos los campos.
+    """
+
+    separator = "\x00"
+
+    def __init__(self, docs: Sequence[str]):
+        self._docs = list(docs)
+        postings: Dict[str, List[int]] = {}
+        for row, doc in enumerate(self._docs):
+            for gram in self._grams(doc):
+                postings.setdefault(gram, []).append(row)
+        self._postings = {
+            gram: np.array(rows, dtype=np.int32) for gram, rows in postings.items()
+        }
+
+    @classmethod
+    def text(cls, record: tuple, fields: Sequence[str]) -> str:
+        """Texto indexado de un registro."""
+        return cls.separator.join(str(getattr(record, f)).lower() for f in fields)
+
+    @classmethod
+    def from_records(cls, records: Iterable[tuple], fields: Sequence[str]):
+        return cls([cls.text(record, fields) for record in records])
+
+    @staticmethod
+    def _grams(text: str) -> set:
+        return {text[i : i + 3] for i in range(len(text) - 2)}
+
+    def search(self, query: str, start: int = 0, end: Optional[int] = None) -> List[int]:
+        """Filas en `[start, end)` cuyo texto contiene `query` (ya en minúsculas)."""
+        end = len(self._docs) if end is None else end
+        candidates: Optional[np.ndarray] = None
+        for gram in self._grams(query):
+            rows = self._postings.get(gram)
+            if rows is None:
+                return []
+            rows = rows[np.searchsorted(rows, start) : np.searchsorted(rows, end)]
+            candidates = (
+                rows
+                if candidates is None
+                else np.intersect1d(candidates, rows, assume_unique=True)
+            )
+            if not len(candidates):
+                return []
+        if candidates is None:
+            candidates = range(start, end)
+        return [int(row) for row in candidates if query in self._docs[row]]
+
+
+class BM25Index:
+    """Índice invertido con puntaje BM25 precalculado por término y fila.
+
+    El aporte de cada término a cada fila se calcula al construir el índice;
+    una consulta solo suma los aportes de sus términos y elige los `k` mejores.
+    """
+
+    def __init__(self, docs: Sequence[str], k1: float = 1.2, b: float = 0.75):
+        self.size = len(docs)
+        postings: Dict[str, Tuple[List[int], List[int]]] = {}
+        lengths = np.zeros(self.size, dtype=np.float32)
+        for row, doc in enumerate(docs):
+            doc_tokens = tokens(doc)
+            lengths[row] = len(doc_tokens)
+            for token, tf in Counter(doc_tokens).items():
+                rows, tfs = postings.setdefault(token, ([], []))
+                rows.append(row)
+                tfs.append(tf)
+        avg_length = float(lengths.mean()) if self.size and lengths.any() else 1.0
+        norm = k1 * (1 - b + b * lengths / avg_length)
+        self._postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for token, (rows, tfs) in postings.items():
+            rows = np.array(rows, dtype=np.int32)
+            tfs = np.array(tfs, dtype=np.float32)
+            idf = np.log1p((self.size - len(rows) + 0.5) / (len(rows) + 0.5))
+            weights = idf * tfs * (k1 + 1) / (tfs + norm[rows])
+            self._postings[token] = (rows, weights.astype(np.float32))
+
+    def top(self, query: str, k: int = 20) -> List[Tuple[int, float]]:
+        """Las `k` filas con mayor puntaje para `query`, de mayor a menor."""
+        matches = [self._postings[t] for t in set(tokens(query)) if t in self._postings]
+        if not matches:
+            return []
+        scores = np.zeros(self.size, dtype=np.float32)
+        for rows, weights in matches:
+            scores[rows] += weights
+        hits = np.unique(np.concatenate([rows for rows, _ in matches]))
+        if len(hits) > k:
+            hits = hits[np.argpartition(-scores[hits], k)[:k]]
+        hits = hits[np.lexsort((hits, -scores[hits]))]
+        return [(int(row), float(scores[row])) for row in hits]
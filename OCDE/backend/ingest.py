@@ -0,0 +1,205 @@
+"""
+Ingesta incremental de las exportaciones a la base de datos.
+
+Compara cada exportación con lo que ya está en las tablas y solo inserta,
+actualiza o elimina las filas que cambiaron, en transacciones por lotes.
+
+Uso (desde la raíz del proyecto, con DB_URL configurada):
+
+    python -m OCDE.backend.ingest
+    python -m OCDE.backend.ingest --academicas nuevas.xlsx --batch-size 10000
+"""
+
+import argparse
+import logging
+import sys
+import time
+from typing import Dict, List, Sequence
+
+import pandas as pd
+import reflex as rx
+import sqlalchemy
+
+from . import store
+from .dataset import (
+    academicas_csv,
+    proyectos_csv,
+    publicaciones_csv,
+    read_source_files,
+)
+from .models import InvestigadorTable, ProyectoTable, PublicacionTable
+
+logger = logging.getLogger(__name__)
+
+# Clave natural de cada tabla. Un mismo proyecto o publicación aparece una
+# vez por cada investigadora UFRO asociada, por eso la clave incluye rut_ir.
+# Aun así las exportaciones traen filas con clave repetida (un mismo proyecto
+# con dos roles, por ejemplo): se conservan todas y se emparejan por orden de
+# aparición, igual que si la tabla se cargara desde cero.
+table_keys = {
+    InvestigadorTable: ["id"],
+    ProyectoTable: ["codigo", "rut_ir"],
+    PublicacionTable: ["wos_id", "rut_ir"],
+}
+
+
+def _batches(rows: Sequence, size: int):
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
+
+
+def _key_tuples(df: pd.DataFrame, key: List[str]) -> List[tuple]:
+    """Clave de cada fila más su número de aparición entre las repetidas."""
+    occurrence = df.groupby(key, sort=False, dropna=False).cumcount()
+    return list(zip(*(df[col].tolist() for col in key), occurrence.tolist()))
+
+
+def _comparable(df: pd.DataFrame, table, columns: List[str]) -> pd.DataFrame:
+    """`columns` con los tipos de la tabla y los nulos como None.
+
+    Lo leído de los archivos y lo leído de la base no comparten tipos (una
+    columna vacía es float NaN en uno y None en la otra); sin esto los hashes
+    de filas iguales no coinciden.
+    """
+    normalized = {}
+    for col in columns:
+        values = df[col]
+        if isinstance(table.c[col].type, sqlalchemy.Integer):
+            values = pd.to_numeric(values, errors="coerce").round().astype("Int64")
+        else:
+            values = values.where(values.isna(), values.astype(str))
+        normalized[col] = values.astype(object).where(values.notna(), None)
+    return pd.DataFrame(normalized, index=df.index, columns=columns)
+
+
+def upsert_table(
+    conn, model, new: pd.DataFrame, batch_size: int, delete_missing: bool = True
+) -> Dict[str, int]:
+    """Sincroniza `model` con `new` y devuelve los conteos de cambios."""
+    table = model.__table__
+    key = table_keys[model]
+    columns = [
+        c.name for c in table.c if (c.name != "id" or "id" in key) and c.name in new
+    ]
+    new = _comparable(new.reset_index(drop=True), table, columns)
+
+    old = pd.read_sql_query(sqlalchemy.select(table).order_by(table.c.id), conn)
+    old_hashes = pd.util.hash_pandas_object(
+        _comparable(old, table, columns), index=False
+    ).tolist()
+    old_by_key = dict(
+        zip(_key_tuples(old, key), zip(old["id"].tolist(), old_hashes))
+    )
+    new_hashes = pd.util.hash_pandas_object(new, index=False).tolist()
+
+    inserts, updates = [], []
+    for row_key, row_hash, record in zip(
+        _key_tuples(new, key), new_hashes, new.to_dict("records")
+    ):
+        previous = old_by_key.pop(row_key, None)
+        if previous is None:
+            inserts.append(record)
+        elif previous[1] != row_hash:
+            updates.append(
+                {"b_id": previous[0], **{f"b_{c}": v for c, v in record.items()}}
+            )
+    deletes = [row_id for row_id, _ in old_by_key.values()] if delete_missing else []
+
+    update_stmt = (
+        table.update()
+        .where(table.c.id == sqlalchemy.bindparam("b_id"))
+        .values({c: sqlalchemy.bindparam(f"b_{c}") for c in columns})
+    )
+    for batch in _batches(inserts, batch_size):
+        conn.execute(table.insert(), batch)
+    for batch in _batches(updates, batch_size):
+        conn.execute(update_stmt, batch)
+    for batch in _batches(deletes, batch_size):
+        conn.execute(table.delete().where(table.c.id.in_(batch)))
+
+    return {
+        "leidas": len(new),
+        "insertadas": len(inserts),
+        "actualizadas": len(updates),
+        "eliminadas": len(deletes),
+    }
+
+
+def ingest_frames(
+    df_academicas: pd.DataFrame,
+    df_proyectos: pd.DataFrame,
+    df_publicaciones: pd.DataFrame,
+    batch_size: int = 5000,
+    delete_missing: bool = True,
+) -> Dict[str, Dict[str, int]]:
+    """Sincroniza las tablas con DataFrames ya normalizados."""
+    engine = rx.model.get_engine()
+    report = {}
+    for model, df in (
+        (InvestigadorTable, df_academicas),
+        (ProyectoTable, df_proyectos),
+        (PublicacionTable, df_publicaciones),
+    ):
+        start = time.perf_counter()
+        with engine.begin() as conn:
+            counts = upsert_table(conn, model, df, batch_size, delete_missing)
+        elapsed = time.perf_counter() - start
+        counts["filas_por_segundo"] = int(counts["leidas"] / elapsed) if elapsed else 0
+        report[model.__tablename__] = counts
+        logger.info(
+            f"{model.__tablename__}: {counts['leidas']} filas en {elapsed:.2f}s "
+            f"({counts['filas_por_segundo']} filas/s), "
+            f"{counts['insertadas']} insertadas, {counts['actualizadas']} actualizadas, "
+            f"{counts['eliminadas']} eliminadas"
+        )
+    return report
+
+
+def ingest(
+    academicas: str = academicas_csv,
+    proyectos: str = proyectos_csv,
+    publicaciones: str = publicaciones_csv,
+    batch_size: int = 5000,
+    delete_missing: bool = True,
+) -> Dict[str, Dict[str, int]]:
+    """Ingresa las tres exportaciones; cada tabla en su propia transacción."""
+    _, *frames = read_source_files(academicas, proyectos, publicaciones)
+    return ingest_frames(*frames, batch_size=batch_size, delete_missing=delete_missing)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Ingesta incremental de académicas, proyectos y publicaciones."
+    )
+    parser.add_argument("--academicas", default=academicas_csv)
+    parser.add_argument("--proyectos", default=proyectos_csv)
+    parser.add_argument("--publicaciones", default=publicaciones_csv)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument(
+        "--no-delete",
+        action="store_true",
+        help="no eliminar filas que ya no vienen en la exportación",
+    )
+    args = parser.parse_args(argv)
+
+    if not store.enabled():
+        print("No hay base de datos configurada (DB_URL).", file=sys.stderr)
+        return 1
+
+    report = ingest(
+        args.academicas,
+        args.proyectos,
+        args.publicaciones,
+        batch_size=args.batch_size,
+        delete_missing=not args.no_delete,
+    )
+    changed = sum(
+        c["insertadas"] + c["actualizadas"] + c["eliminadas"] for c in report.values()
+    )
+    print(f"Filas modificadas: {changed}")
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
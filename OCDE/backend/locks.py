@@ -0,0 +1,25 @@
+"""
+Bloqueos entre procesos.
+
+Con varios workers cada uno corre sus propias tareas de ciclo de vida; las
+que escriben en disco compartido (ingesta y exportación estática) se
+serializan con un archivo de bloqueo.
+"""
+
+import fcntl
+import os
+from contextlib import contextmanager
+from pathlib import Path
+
+
+@contextmanager
+def file_lock(path: os.PathLike):
+    """Mantiene un bloqueo exclusivo sobre `path` (se crea si no existe)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
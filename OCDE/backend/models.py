@@ -1,4 +1,5 @@
 import reflex as rx
+import sqlmodel
 from typing import Optional, List
 
 # modelo de la base de datos para los investigadores
@@ -44,4 +45,52 @@ class Proyectos(rx.Base):
     investigador_responsable: str
     rut_ir: str
     rol: str
-    
\ No newline at end of file
+    
+
+# tablas de la base de datos (SQLite); las columnas siguen a los modelos de
+# arriba más las que usan los buscadores de las tablas y los indicadores
+class InvestigadorTable(rx.Model, table=True):
+    __tablename__ = "investigador"
+
+    rut_ir: str = sqlmodel.Field(index=True)
+    name: str
+    orcid: Optional[str] = None
+    ocde_2: Optional[str] = sqlmodel.Field(default=None, index=True)
+    ocde_3: Optional[str] = None
+    email: Optional[str] = None
+    grado_mayor: Optional[str] = None
+    unidad_contrato: Optional[str] = None
+
+
+class ProyectoTable(rx.Model, table=True):
+    __tablename__ = "proyecto"
+
+    codigo: str = sqlmodel.Field(index=True)
+    titulo: str
+    año: int = sqlmodel.Field(index=True)
+    ocde_2: str = sqlmodel.Field(index=True)
+    tipo_proyecto: str
+    investigador_responsable: str
+    rut_ir: str = sqlmodel.Field(index=True)
+    rol: str
+    disciplina: Optional[str] = None
+    co_investigador: Optional[str] = None
+    unidad: Optional[str] = None
+
+
+class PublicacionTable(rx.Model, table=True):
+    __tablename__ = "publicacion"
+
+    año: int = sqlmodel.Field(index=True)
+    titulo: str
+    revista: str
+    cuartil: str
+    rut_ir: str = sqlmodel.Field(index=True)
+    genero: str
+    autor: str
+    wos_id: str = sqlmodel.Field(index=True)
+    liderado: str
+    url: str
+    doi: str
+    disciplina: Optional[str] = None
+    unidad: Optional[str] = None
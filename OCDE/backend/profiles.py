@@ -0,0 +1,66 @@
+"""
+Resumen precalculado del perfil de cada investigadora.
+
+Se construye junto con la instantánea (al cargar o recargar los datos), de
+modo que abrir /investigadora/[id] se resuelve con una sola búsqueda por id:
+conteos, histograma de años y la primera página de cada tabla ya convertida
+a los modelos que se envían al navegador.
+"""
+
+from collections import Counter
+from typing import Dict, NamedTuple, Sequence, Tuple
+
+from .indexes import RowRanges
+from .models import Proyectos, Publicaciones
+from .records import InvestigadorRecord, to_models
+
+# Filas de la primera página de cada tabla del perfil
+profile_page_size = 24
+
+
+class ProfileBundle(NamedTuple):
+    investigador: InvestigadorRecord
+    # Rango de sus filas en los registros de la instantánea
+    proyectos_rows: slice
+    publicaciones_rows: slice
+    n_proyectos: int
+    n_publicaciones: int
+    # año → cantidad de proyectos
+    años_proyectos: Dict[int, int]
+    primeros_proyectos: Tuple[Proyectos, ...]
+    primeras_publicaciones: Tuple[Publicaciones, ...]
+
+
+def build_profiles(
+    investigadores: Sequence[InvestigadorRecord],
+    proyectos: Sequence[tuple],
+    proyectos_por_rut: RowRanges,
+    publicaciones: Sequence[tuple],
+    publicaciones_por_rut: RowRanges,
+) -> Dict[int, ProfileBundle]:
+    """Un resumen por investigadora, indexado por su id."""
+    profiles = {}
+    for inv in investigadores:
+        proy = proyectos_por_rut.rows(inv.rut_ir)
+        pub = publicaciones_por_rut.rows(inv.rut_ir)
+        mis_proyectos = proyectos[proy]
+        profiles[inv.id] = ProfileBundle(
+            investigador=inv,
+            proyectos_rows=proy,
+            publicaciones_rows=pub,
+            n_proyectos=proy.stop - proy.start,
+            n_publicaciones=pub.stop - pub.start,
+            años_proyectos=dict(
+                sorted(Counter(p.año for p in mis_proyectos).items())
+            ),
+            primeros_proyectos=tuple(
+                to_models(Proyectos, mis_proyectos[:profile_page_size])
+            ),
+            primeras_publicaciones=tuple(
+                to_models(
+                    Publicaciones,
+                    publicaciones[pub.start : pub.start + profile_page_size],
+                )
+            ),
+        )
+    return profiles
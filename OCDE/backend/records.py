@@ -0,0 +1,105 @@
+"""
+Registros compactos para el almacenamiento interno de los datos.
+
+Las instantáneas guardan tuplas con nombre construidas en bloque desde las
+columnas de los DataFrames; los modelos `rx.Base` (con su validación) solo se
+crean para las filas que efectivamente se envían al navegador.
+"""
+
+from collections import namedtuple
+from typing import Iterable, List, Sequence, Tuple, Type
+
+import pandas as pd
+import reflex as rx
+
+from .indexes import fold
+from .models import Investigador, Proyectos, Publicaciones
+
+# Columnas que se conservan de cada fuente: las de los modelos más las que
+# usan los buscadores de las tablas y los cubos de indicadores
+investigador_columns = list(Investigador.__fields__)
+proyecto_columns = list(Proyectos.__fields__) + [
+    "disciplina",
+    "co_investigador",
+    "unidad",
+]
+publicacion_columns = list(Publicaciones.__fields__) + [
+    "disciplina",
+    "unidad",
+]
+
+# Campos que no se publican fuera de la aplicación (API y exportaciones)
+private_fields = {"email"}
+
+# Campos que revisan los buscadores de las tablas del perfil
+proyecto_search_fields = [
+    "codigo",
+    "titulo",
+    "año",
+    "disciplina",
+    "tipo_proyecto",
+    "investigador_responsable",
+    "co_investigador",
+    "unidad",
+]
+publicacion_search_fields = [
+    "año",
+    "titulo",
+    "revista",
+    "cuartil",
+    "autor",
+    "wos_id",
+    "liderado",
+    "url",
+]
+
+# Columnas por las que se pueden ordenar las tablas del perfil
+proyecto_sort_fields = ["año", "titulo", "tipo_proyecto"]
+publicacion_sort_fields = ["año", "titulo", "revista", "cuartil"]
+
+InvestigadorRecord = namedtuple("InvestigadorRecord", investigador_columns)
+ProyectoRecord = namedtuple("ProyectoRecord", proyecto_columns)
+PublicacionRecord = namedtuple("PublicacionRecord", publicacion_columns)
+
+
+def build_records(df: pd.DataFrame, record_type: Type[tuple]) -> Tuple[tuple, ...]:
+    """Construye un registro por fila a partir de columnas completas."""
+    columns = [
+        df[field].tolist() if field in df.columns else [None] * len(df)
+        for field in record_type._fields
+    ]
+    return tuple(map(record_type._make, zip(*columns)))
+
+
+def to_models(model: Type[rx.Base], records: Iterable[tuple]) -> List[rx.Base]:
+    """Convierte registros al modelo que se envía al navegador."""
+    return [model(**record._asdict()) for record in records]
+
+
+def to_model(model: Type[rx.Base], record: Sequence) -> rx.Base:
+    return model(**record._asdict())
+
+
+def sort_order(
+    records: Sequence[tuple], field: str, reverse: bool = False
+) -> List[int]:
+    """Posiciones de `records` ordenadas por `field` (estable).
+
+    Los textos se comparan sin tildes ni mayúsculas. Los valores vacíos (o año
+    0) quedan al final en ambos sentidos: `reverse` solo invierte el orden de
+    los informados.
+    """
+
+    # Con `reverse` se ordena de mayor a menor: el primer componente también
+    # se invierte para que los vacíos sigan quedando al final
+    filled, empty = (1, 0) if reverse else (0, 1)
+
+    def key(row: int):
+        value = getattr(records[row], field)
+        if value is None or value == "" or value == 0 or pd.isna(value):
+            return (empty, 0, "")
+        if isinstance(value, (int, float)):
+            return (filled, value, "")
+        return (filled, 0, fold(str(value)))
+
+    return sorted(range(len(records)), key=key, reverse=reverse)
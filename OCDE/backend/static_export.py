@@ -0,0 +1,255 @@
+"""
+Exportación estática de los perfiles de investigadoras.
+
+Por cada investigadora se escriben `perfiles/<id>.json` (los datos del
+perfil) y `perfiles/<id>.html` (una página legible sin JavaScript), que
+Caddy sirve directamente sin pasar por el backend. `perfiles/index.html` y
+`perfiles/sitemap.xml` enlazan todas las páginas para que los buscadores las
+encuentren, y la página dinámica /investigadora/[id] declara la estática como
+canónica.
+
+La exportación se hace al arrancar y cada vez que se publica una instantánea
+nueva; si el contenido de las fuentes no cambió, se conserva la anterior.
+Todos los workers corren la tarea, pero solo uno exporta a la vez: el
+bloqueo de archivo protege el reemplazo del directorio y los demás encuentran
+la exportación ya al día.
+
+Uso manual (desde la raíz del proyecto):
+
+    python -m OCDE.backend.static_export --out data/export
+"""
+
+import argparse
+import asyncio
+import html
+import json
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+
+from .dataset import Dataset, get_dataset, watch_interval
+from .locks import file_lock
+from .models import Investigador, Proyectos, Publicaciones
+from .records import private_fields, to_model, to_models
+
+logger = logging.getLogger(__name__)
+
+# Directorio de salida; en Docker vive en el volumen /app/data, que Caddy
+# monta de solo lectura
+export_dir = Path(os.getenv("OCDE_STATIC_EXPORT_DIR", "data/export"))
+enabled = os.getenv("OCDE_STATIC_EXPORT", "1") != "0"
+
+# Versión del formato de salida (plantillas, campos, archivos). Forma parte
+# del manifiesto: debe subirse cada vez que cambie lo que se escribe, para que
+# una exportación anterior con los mismos datos se regenere.
+export_format = 2
+
+# URL pública del sitio, para las direcciones absolutas (sitemap y canónicas)
+site_url = os.getenv("OCDE_SITE_URL", "http://localhost").rstrip("/")
+
+
+def profile_path(inv_id: int) -> str:
+    """Ruta pública de la página estática de una investigadora."""
+    return f"/perfiles/{inv_id}.html"
+
+
+def profile_payload(dataset: Dataset, inv_id: int) -> dict:
+    """Datos del perfil de una investigadora, listos para JSON."""
+    bundle = dataset.perfiles[inv_id]
+    investigadora = to_model(Investigador, bundle.investigador).dict()
+    for field in private_fields:
+        investigadora.pop(field, None)
+    return {
+        "version": dataset.fingerprint(),
+        "investigadora": investigadora,
+        "n_proyectos": bundle.n_proyectos,
+        "n_publicaciones": bundle.n_publicaciones,
+        "años_proyectos": {str(año): n for año, n in bundle.años_proyectos.items()},
+        "proyectos": [
+            p.dict()
+            for p in to_models(Proyectos, dataset.proyectos[bundle.proyectos_rows])
+        ],
+        "publicaciones": [
+            p.dict()
+            for p in to_models(
+                Publicaciones, dataset.publicaciones[bundle.publicaciones_rows]
+            )
+        ],
+    }
+
+
+def _rows(items: list, columns: list) -> str:
+    return "\n".join(
+        "<tr>"
+        + "".join(f"<td>{html.escape(str(item[col]))}</td>" for col in columns)
+        + "</tr>"
+        for item in items
+    )
+
+
+def profile_html(payload: dict) -> str:
+    inv = payload["investigadora"]
+    name = html.escape(inv["name"])
+    return f"""<!DOCTYPE html>
+<html lang="es">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{name} · Investigadoras UFRO</title>
+<meta name="description" content="{name}: {payload["n_proyectos"]} proyectos y {payload["n_publicaciones"]} publicaciones.">
+<link rel="canonical" href="{site_url}{profile_path(inv["id"])}">
+<link rel="alternate" type="application/json" href="/perfiles/{inv["id"]}.json">
+</head>
+<body>
+<h1>{name}</h1>
+<p>{html.escape(inv.get("grado_mayor") or "")}</p>
+<p>Disciplinas OCDE: {html.escape(inv.get("ocde_2") or "")}</p>
+<p><a href="/investigadora/{inv["id"]}">Ver perfil interactivo</a></p>
+<h2>Proyectos ({payload["n_proyectos"]})</h2>
+<table>
+<tr><th>Código</th><th>Título</th><th>Año</th><th>Tipo proyecto</th><th>Rol</th></tr>
+{_rows(payload["proyectos"], ["codigo", "titulo", "año", "tipo_proyecto", "rol"])}
+</table>
+<h2>Publicaciones ({payload["n_publicaciones"]})</h2>
+<table>
+<tr><th>Año</th><th>Título</th><th>Revista</th><th>Cuartil</th></tr>
+{_rows(payload["publicaciones"], ["año", "titulo", "revista", "cuartil"])}
+</table>
+</body>
+</html>
+"""
+
+
+def index_html(dataset: Dataset) -> str:
+    links = "\n".join(
+        f'<li><a href="{profile_path(inv.id)}">{html.escape(inv.name)}</a></li>'
+        for inv in dataset.investigadores
+    )
+    return f"""<!DOCTYPE html>
+<html lang="es">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Investigadoras UFRO</title>
+</head>
+<body>
+<h1>Investigadoras UFRO</h1>
+<ul>
+{links}
+</ul>
+</body>
+</html>
+"""
+
+
+def sitemap_xml(dataset: Dataset) -> str:
+    urls = "\n".join(
+        f"<url><loc>{html.escape(site_url + profile_path(inv.id))}</loc></url>"
+        for inv in dataset.investigadores
+    )
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+{urls}
+</urlset>
+"""
+
+
+def export_profiles(dataset: Dataset, out: Path = export_dir, force: bool = False) -> bool:
+    """Escribe los perfiles de `dataset` en `out/perfiles`.
+
+    Se escribe en un directorio temporal que luego reemplaza al anterior, de
+    modo que Caddy nunca sirve una exportación a medias. Devuelve False si la
+    exportación existente ya corresponde al mismo contenido y formato.
+    """
+    out.mkdir(parents=True, exist_ok=True)
+    with file_lock(out / ".perfiles.lock"):
+        return _export_locked(dataset, out, force)
+
+
+def _export_locked(dataset: Dataset, out: Path, force: bool) -> bool:
+    target = out / "perfiles"
+    manifest = target / "index.json"
+    fingerprint = dataset.fingerprint()
+    try:
+        current = json.loads(manifest.read_text())
+        if (
+            not force
+            and current["version"] == fingerprint
+            and current["formato"] == export_format
+        ):
+            return False
+    except (OSError, ValueError, KeyError):
+        pass
+
+    start = time.perf_counter()
+    tmp = out / f".perfiles-{os.getpid()}"
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+    for inv_id in dataset.perfiles:
+        payload = profile_payload(dataset, inv_id)
+        (tmp / f"{inv_id}.json").write_text(
+            json.dumps(payload, ensure_ascii=False), encoding="utf-8"
+        )
+        (tmp / f"{inv_id}.html").write_text(profile_html(payload), encoding="utf-8")
+    (tmp / "index.json").write_text(
+        json.dumps(
+            {
+                "version": fingerprint,
+                "formato": export_format,
+                "investigadoras": [
+                    {"id": inv.id, "name": inv.name, "url": profile_path(inv.id)}
+                    for inv in dataset.investigadores
+                ],
+            },
+            ensure_ascii=False,
+        ),
+        encoding="utf-8",
+    )
+    (tmp / "index.html").write_text(index_html(dataset), encoding="utf-8")
+    (tmp / "sitemap.xml").write_text(sitemap_xml(dataset), encoding="utf-8")
+
+    old = out / f".perfiles-old-{os.getpid()}"
+    if target.exists():
+        target.rename(old)
+    tmp.rename(target)
+    shutil.rmtree(old, ignore_errors=True)
+    logger.info(
+        f"Exportados {len(dataset.perfiles)} perfiles estáticos en "
+        f"{time.perf_counter() - start:.2f}s ({target})"
+    )
+    return True
+
+
+async def export_static_profiles():
+    """Tarea de ciclo de vida que exporta los perfiles de cada instantánea."""
+    if not enabled:
+        return
+    exported_version = None
+    while True:
+        try:
+            dataset = await asyncio.to_thread(get_dataset)
+            if dataset.version != exported_version:
+                await asyncio.to_thread(export_profiles, dataset)
+                exported_version = dataset.version
+        except Exception as e:
+            # Caddy sigue sirviendo la exportación anterior
+            logger.error(f"Error exportando perfiles estáticos: {e}")
+        await asyncio.sleep(watch_interval)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--out", type=Path, default=export_dir)
+    parser.add_argument(
+        "--force", action="store_true", help="Reescribe aunque no haya cambios"
+    )
+    args = parser.parse_args(argv)
+    export_profiles(get_dataset(), args.out, force=args.force)
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    raise SystemExit(main())
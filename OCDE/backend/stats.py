@@ -0,0 +1,249 @@
+"""
+Cubos de indicadores de proyectos y publicaciones.
+
+Se construyen una vez por instantánea con un solo `groupby` sobre todas las
+filas: cada celda es una combinación año × disciplina × unidad × tipo de
+proyecto × cuartil con sus totales. Los gráficos filtran y suman esas celdas
+(unos pocos miles) en lugar de recorrer proyectos y publicaciones.
+
+El cubo de género cuenta, con las mismas dimensiones salvo el tipo de
+proyecto, las publicaciones lideradas por investigadoras (`genero` y
+`liderado` de cada publicación).
+"""
+
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Dimensiones y medidas del cubo de proyectos y publicaciones
+dimensions = ("año", "disciplina", "unidad", "tipo_proyecto", "cuartil")
+measures = ("proyectos", "publicaciones")
+
+# Dimensiones y medidas del cubo de género
+gender_dimensions = ("año", "disciplina", "unidad", "cuartil")
+gender_measures = ("publicaciones", "lideradas", "lideradas_mujeres")
+
+# Valores (en minúsculas) que marcan a una mujer y a una publicación liderada
+women = {"f", "femenino", "mujer"}
+led = {"si", "sí", "s", "yes", "true", "1"}
+
+# Filtros de la página de estadísticas (`State.selected_items`) → dimensión
+filter_dimensions = {
+    "años": "año",
+    "disciplinas": "disciplina",
+    "unidades": "unidad",
+    "tipos": "tipo_proyecto",
+    "cuartiles": "cuartil",
+}
+
+# Valor de las filas que no informan una dimensión (el mismo que usa la
+# carga para el área OCDE de los proyectos)
+missing = "SIN INFO"
+
+
+class StatsCube:
+    """Totales de `measures` agregados por todas las combinaciones de `dimensions`.
+
+    Una dimensión nula en una fila significa que no aplica (el cuartil de un
+    proyecto): esa fila no se descarta al filtrar por la dimensión, pero
+    tampoco aparece al agrupar por ella.
+    """
+
+    def __init__(
+        self, facts: pd.DataFrame, dimensions: Sequence[str], measures: Sequence[str]
+    ):
+        self.dimensions = tuple(dimensions)
+        self.measures = tuple(measures)
+        cells = (
+            facts.groupby(list(self.dimensions), dropna=False, sort=False)[
+                list(self.measures)
+            ]
+            .sum()
+            .reset_index()
+        )
+        self._values: Dict[str, List[str]] = {}
+        self._positions: Dict[str, Dict[str, int]] = {}
+        self._codes: Dict[str, np.ndarray] = {}
+        for dim in self.dimensions:
+            values = sorted(
+                cells[dim].dropna().unique().tolist(), key=lambda v: (v == missing, v)
+            )
+            self._values[dim] = values
+            self._positions[dim] = {value: i for i, value in enumerate(values)}
+            self._codes[dim] = pd.Categorical(cells[dim], categories=values).codes
+        self._totals = cells[list(self.measures)].to_numpy(dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self._totals)
+
+    def values(self, dim: str) -> List[str]:
+        """Valores de `dim` presentes en los datos, ordenados."""
+        return list(self._values[dim])
+
+    def _mask(self, filters: Optional[Mapping[str, Iterable[str]]]) -> np.ndarray:
+        mask = np.ones(len(self._totals), dtype=bool)
+        for dim, selected in (filters or {}).items():
+            # La última posición corresponde al código -1 (no aplica)
+            wanted = np.zeros(len(self._values[dim]) + 1, dtype=bool)
+            wanted[-1] = True
+            positions = self._positions[dim]
+            wanted[[positions[v] for v in selected if v in positions]] = True
+            mask &= wanted[self._codes[dim]]
+        return mask
+
+    def totals(
+        self, filters: Optional[Mapping[str, Iterable[str]]] = None
+    ) -> Dict[str, int]:
+        """Totales de cada medida dentro de `filters` (dimensión → valores)."""
+        summed = self._totals[self._mask(filters)].sum(axis=0)
+        return {m: int(summed[i]) for i, m in enumerate(self.measures)}
+
+    def slice(
+        self, by: str, filters: Optional[Mapping[str, Iterable[str]]] = None
+    ) -> List[Dict[str, object]]:
+        """Totales por valor de `by`, dentro de `filters`.
+
+        Se omiten los valores sin ningún total.
+        """
+        mask = self._mask(filters)
+        codes = self._codes[by]
+        mask &= codes >= 0
+        summed = np.zeros((len(self._values[by]), len(self.measures)), dtype=np.int64)
+        np.add.at(summed, codes[mask], self._totals[mask])
+        return [
+            {by: value, **{m: int(row[i]) for i, m in enumerate(self.measures)}}
+            for value, row in zip(self._values[by], summed)
+            if row.any()
+        ]
+
+
+def _text(series: pd.Series) -> pd.Series:
+    text = series.fillna("").astype(str).str.strip()
+    return text.mask(text == "", missing)
+
+
+def _year(series: pd.Series) -> pd.Series:
+    # La carga deja en 0 los años que no se pudieron leer
+    years = pd.to_numeric(series, errors="coerce").round().astype("Int64")
+    years = years.mask(years == 0).astype("string")
+    return years.fillna(missing).astype(object)
+
+
+def investigator_dimensions(df_academicas: pd.DataFrame) -> pd.DataFrame:
+    """Disciplina (primera área OCDE) y unidad de cada rut_ir.
+
+    Solo se usan para las filas que no informan las propias.
+    """
+    academicas = df_academicas.drop_duplicates("rut_ir").set_index("rut_ir")
+    return pd.DataFrame(
+        {
+            "disciplina": _text(
+                academicas["ocde_2"].fillna("").astype(str).str.split(",").str[0]
+            ),
+            "unidad": _text(academicas["unidad_contrato"]),
+        }
+    )
+
+
+def _own_or_investigator(
+    df: pd.DataFrame, column: str, rut_values: pd.Series
+) -> pd.Series:
+    """`column` de cada fila; si viene vacía, la de su investigadora."""
+    own = _text(df[column]) if column in df else pd.Series(missing, index=df.index)
+    fallback = df["rut_ir"].map(rut_values).fillna(missing)
+    return own.mask(own == missing, fallback)
+
+
+def build_cube(
+    df_academicas: pd.DataFrame,
+    df_proyectos: pd.DataFrame,
+    df_publicaciones: pd.DataFrame,
+) -> StatsCube:
+    """Cubo de proyectos y publicaciones de una instantánea.
+
+    Los proyectos usan su propia área OCDE y las publicaciones su disciplina;
+    ambos, su propia unidad. Una publicación sin disciplina, o una fila sin
+    unidad, toma la de su investigadora.
+    """
+    por_rut = investigator_dimensions(df_academicas)
+
+    proyectos = pd.DataFrame(
+        {
+            "año": _year(df_proyectos["año"]),
+            "disciplina": _text(df_proyectos["ocde_2"]),
+            "unidad": _own_or_investigator(df_proyectos, "unidad", por_rut["unidad"]),
+            "tipo_proyecto": _text(df_proyectos["tipo_proyecto"]),
+            "cuartil": None,
+            "proyectos": 1,
+            "publicaciones": 0,
+        }
+    )
+    publicaciones = pd.DataFrame(
+        {
+            "año": _year(df_publicaciones["año"]),
+            "disciplina": _own_or_investigator(
+                df_publicaciones, "disciplina", por_rut["disciplina"]
+            ),
+            "unidad": _own_or_investigator(
+                df_publicaciones, "unidad", por_rut["unidad"]
+            ),
+            "tipo_proyecto": None,
+            "cuartil": _text(df_publicaciones["cuartil"]),
+            "proyectos": 0,
+            "publicaciones": 1,
+        }
+    )
+    return StatsCube(
+        pd.concat([proyectos, publicaciones], ignore_index=True), dimensions, measures
+    )
+
+
+def _flag(series: pd.Series, accepted: set) -> pd.Series:
+    return series.fillna("").astype(str).str.strip().str.lower().isin(accepted)
+
+
+def build_gender_cube(
+    df_academicas: pd.DataFrame, df_publicaciones: pd.DataFrame
+) -> StatsCube:
+    """Cubo de publicaciones lideradas, y lideradas por mujeres.
+
+    Como en `build_cube`, cada publicación usa su propia disciplina y unidad.
+    """
+    por_rut = investigator_dimensions(df_academicas)
+    lideradas = _flag(df_publicaciones["liderado"], led)
+    facts = pd.DataFrame(
+        {
+            "año": _year(df_publicaciones["año"]),
+            "disciplina": _own_or_investigator(
+                df_publicaciones, "disciplina", por_rut["disciplina"]
+            ),
+            "unidad": _own_or_investigator(
+                df_publicaciones, "unidad", por_rut["unidad"]
+            ),
+            "cuartil": _text(df_publicaciones["cuartil"]),
+            "publicaciones": 1,
+            "lideradas": lideradas.astype(int),
+            "lideradas_mujeres": (
+                lideradas & _flag(df_publicaciones["genero"], women)
+            ).astype(int),
+        }
+    )
+    return StatsCube(facts, gender_dimensions, gender_measures)
+
+
+def _percent(part: int, total: int) -> float:
+    return round(100 * part / total, 1) if total else 0.0
+
+
+def gender_shares(totals: Mapping[str, object]) -> Dict[str, object]:
+    """Agrega a los totales del cubo de género sus porcentajes.
+
+    `pct_mujeres` es la parte de todas las publicaciones que lidera una
+    mujer; `pct_lideradas`, la parte de las publicaciones lideradas.
+    """
+    return {
+        **totals,
+        "pct_mujeres": _percent(totals["lideradas_mujeres"], totals["publicaciones"]),
+        "pct_lideradas": _percent(totals["lideradas_mujeres"], totals["lideradas"]),
+    }
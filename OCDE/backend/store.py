@@ -0,0 +1,51 @@
+"""
+Almacenamiento de investigadoras, proyectos y publicaciones en la base de
+datos configurada en `db_url` (SQLite en Docker).
+
+Cuando hay base de datos, las instantáneas del registro se construyen desde
+estas tablas indexadas en vez de leer las planillas; si los archivos de origen
+están presentes se ingresan antes a las tablas (ver `dataset._load_frames`).
+"""
+
+import logging
+from typing import Optional, Tuple
+
+import pandas as pd
+import reflex as rx
+import sqlalchemy
+
+from .models import InvestigadorTable, ProyectoTable, PublicacionTable
+
+logger = logging.getLogger(__name__)
+
+
+def enabled() -> bool:
+    """Indica si la aplicación tiene una base de datos configurada."""
+    return bool(rx.config.get_config().db_url)
+
+
+def sqlite_path() -> Optional[str]:
+    """Ruta del archivo SQLite, o None si la base de datos no es SQLite."""
+    url = sqlalchemy.engine.make_url(rx.config.get_config().db_url)
+    if url.get_backend_name() != "sqlite":
+        return None
+    return url.database
+
+
+def _read_table(model, engine, keep_id: bool) -> pd.DataFrame:
+    table = model.__table__
+    columns = [c for c in table.c if keep_id or c.name != "id"]
+    # Proyectos y publicaciones salen ya agrupados por rut_ir (su índice)
+    order = [table.c.rut_ir, table.c.id] if not keep_id else [table.c.id]
+    query = sqlalchemy.select(*columns).order_by(*order)
+    return pd.read_sql_query(query, engine)
+
+
+def read_frames() -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Lee las tres tablas como DataFrames normalizados."""
+    engine = rx.model.get_engine()
+    return (
+        _read_table(InvestigadorTable, engine, keep_id=True),
+        _read_table(ProyectoTable, engine, keep_id=False),
+        _read_table(PublicacionTable, engine, keep_id=False),
+    )
@@ -1,6 +1,6 @@
 import reflex as rx
 from ..backend.backend import State
-from typing import List, Dict
+from typing import Dict
 
 from reflex.components.radix.themes.base import (
     LiteralAccentColor,
@@ -38,17 +38,17 @@ def _selected_item_badge(
 
 
 def _unselected_item_badge(
-    item_name: str, items_dict: Dict[str, LiteralAccentColor], items: List
+    item_name: str, items_dict: Dict[str, LiteralAccentColor], item: str
 ) -> rx.Component:
     return rx.cond(
-        State.selected_items[item_name].contains(items[0]),
+        State.selected_items[item_name].contains(item),
         rx.box(),
         rx.badge(
-            items[0],
+            item,
             rx.icon("plus", size=18),
-            color_scheme=_get_item_color(items[0], items_dict),
+            color_scheme=_get_item_color(item, items_dict),
             **badge_props,
-            on_click=lambda: State.add_selected(item_name, items[0]),
+            on_click=lambda: State.add_selected(item_name, item),
         ),
     )
 
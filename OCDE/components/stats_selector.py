@@ -1,14 +1,19 @@
 import reflex as rx
 from ..backend.backend import State
-# from ..backend.data_items import teams_dict, position_dict, college_dict
-from ..backend.data_items import años_dict, disciplinas_dict, unidades_dict
+from ..backend.data_items import (
+    años_dict,
+    cuartiles_dict,
+    disciplinas_dict,
+    tipos_dict,
+    unidades_dict,
+)
 from .item_badges import _selected_item_badge, _unselected_item_badge
 
 
 def _add_all_button(on_click: callable) -> rx.Component:
     return rx.button(
         rx.icon("plus", size=16),
-        "Add All",
+        "Agregar todos",
         variant="soft",
         size="2",
         on_click=on_click,
@@ -20,7 +25,7 @@ def _add_all_button(on_click: callable) -> rx.Component:
 def _clear_button(on_click: callable) -> rx.Component:
     return rx.button(
         rx.icon("trash", size=16),
-        "Clear",
+        "Quitar todos",
         variant="soft",
         size="2",
         on_click=on_click,
@@ -53,7 +58,8 @@ def _items_selector(item: str, items_dict: dict) -> rx.Component:
         rx.divider(),
         rx.flex(
             rx.foreach(
-                items_dict, lambda unselected_item: _unselected_item_badge(item, items_dict, unselected_item)
+                State.stats_items[item],
+                lambda unselected_item: _unselected_item_badge(item, items_dict, unselected_item),
             ),
             wrap="wrap",
         ),
@@ -82,71 +88,36 @@ def _accordion_header(icon: str, text: str) -> rx.Component:
     )
 
 
-# def _age_selector() -> rx.Component:
-#     return rx.vstack(
-#         rx.slider(
-#             default_value=[19, 40],
-#             min=19,
-#             variant="soft",
-#             max=40,
-#             on_change=State.set_age,
-#         ),
-#         rx.hstack(
-#             rx.badge("Min Age: ", State.age[0]),
-#             rx.spacer(),
-#             rx.badge("Max Age: ", State.age[1]),
-#             width="100%",
-#         ),
-#         width="100%",
-#     )
-
-
-# def _salary_selector() -> rx.Component:
-#     return rx.vstack(
-#         rx.slider(
-#             default_value=[0, 25000000],
-#             min=0,
-#             variant="soft",
-#             max=25000000,
-#             on_value_commit=State.set_salary,
-#         ),
-#         rx.hstack(
-#             rx.badge("Min Salary: ", State.salary[0]),
-#             rx.spacer(),
-#             rx.badge("Max Salary: ", State.salary[1]),
-#             width="100%",
-#         ),
-#         width="100%",
-#     )
-
-
 def stats_selector() -> rx.Component:
     return rx.accordion.root(
         rx.accordion.item(
             header=_accordion_header_stat("calendar", "Años", "años"),
-            # content=_items_selector("teams", teams_dict),
             content=_items_selector("años", años_dict),
             value="años",
         ),
         rx.accordion.item(
             header=_accordion_header_stat("list", "Disciplinas", "disciplinas"),
-            # content=_items_selector("positions", position_dict),
             content=_items_selector("disciplinas", disciplinas_dict),
             value="disciplinas",
         ),
         rx.accordion.item(
             header=_accordion_header_stat("school", "Unidad", "unidades"),
-            # content=_items_selector("colleges", college_dict),
             content=_items_selector("unidades", unidades_dict),
             value="unidades",
         ),
-
+        rx.accordion.item(
+            header=_accordion_header_stat("folder", "Tipo de proyecto", "tipos"),
+            content=_items_selector("tipos", tipos_dict),
+            value="tipos",
+        ),
+        rx.accordion.item(
+            header=_accordion_header_stat("award", "Cuartil", "cuartiles"),
+            content=_items_selector("cuartiles", cuartiles_dict),
+            value="cuartiles",
+        ),
         collapsible=True,
-        default_value="teams",
+        default_value="años",
         type="single",
         variant="ghost",
         width="100%",
     )
-
-
-
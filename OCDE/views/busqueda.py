@@ -0,0 +1,69 @@
+import reflex as rx
+from ..backend.backend import State
+
+
+def resultado_card(item: dict) -> rx.Component:
+    return rx.card(
+        rx.vstack(
+            rx.hstack(
+                rx.badge(
+                    item["tipo"],
+                    color_scheme=rx.cond(item["tipo"] == "Proyecto", "purple", "indigo"),
+                    variant="surface",
+                ),
+                rx.text(item["año"], size="2", class_name="text-gray-600"),
+                spacing="2",
+                align="center",
+            ),
+            rx.text(item["titulo"], size="3", weight="medium", class_name="text-indigo-900"),
+            rx.text(item["detalle"], size="2", class_name="text-gray-600"),
+            rx.cond(
+                item["investigadora_id"],
+                rx.link(
+                    rx.hstack(
+                        rx.icon("user-round", size=16),
+                        rx.text(item["investigadora"], size="2"),
+                        spacing="1",
+                        align="center",
+                    ),
+                    href=f"/investigadora/{item['investigadora_id']}",
+                    class_name="text-purple-700",
+                ),
+            ),
+            spacing="1",
+            width="100%",
+        ),
+        width="100%",
+        class_name="shadow-sm",
+    )
+
+
+def busqueda_global() -> rx.Component:
+    return rx.vstack(
+        rx.input(
+            rx.input.slot(rx.icon("file-search")),
+            rx.input.slot(
+                rx.icon("x", on_click=State.clear_search("global_search_term")),
+                justify="end",
+                cursor="pointer",
+            ),
+            value=State.global_search_term_input,
+            placeholder="Buscar en todos los proyectos y publicaciones",
+            size="3",
+            width="100%",
+            variant="surface",
+            color_scheme="indigo",
+            on_change=lambda val: State.type_search("global_search_term", val),
+        ),
+        rx.cond(
+            State.global_results,
+            rx.vstack(
+                rx.foreach(State.global_results, resultado_card),
+                spacing="2",
+                width="100%",
+            ),
+        ),
+        spacing="3",
+        width="100%",
+        class_name="bg-white md:px-40 p-5",
+    )
@@ -0,0 +1,21 @@
+import reflex as rx
+from ..backend.backend import State
+
+
+def export_menu(tabla: str, color_scheme: str = "indigo") -> rx.Component:
+    """Botón de descarga del resultado filtrado de `tabla`."""
+    return rx.menu.root(
+        rx.menu.trigger(
+            rx.button(
+                rx.icon("download", size=16),
+                "Descargar",
+                color_scheme=color_scheme,
+                variant="soft",
+            ),
+        ),
+        rx.menu.content(
+            rx.menu.item("CSV", on_click=State.exportar(tabla, "csv")),
+            rx.menu.item("Excel (XLSX)", on_click=State.exportar(tabla, "xlsx")),
+            rx.menu.item("JSON", on_click=State.exportar(tabla, "json")),
+        ),
+    )
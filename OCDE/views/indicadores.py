@@ -0,0 +1,223 @@
+import reflex as rx
+from ..backend.backend import State
+from ..backend.stats import gender_dimensions, gender_shares
+
+# Dimensiones del cubo de género → nombre en los selectores
+gender_views = {
+    "año": "Año",
+    "disciplina": "Área OCDE",
+    "cuartil": "Cuartil",
+    "unidad": "Unidad",
+}
+
+# Valor de los filtros que no restringen nada
+todos = "todos"
+
+
+class GeneroState(State):
+    genero_vista: str = "año"
+    genero_filtros: dict[str, str] = {dim: todos for dim in gender_dimensions}
+
+    @rx.event
+    async def load_indicadores(self):
+        await self._load_dataset()
+
+    @rx.event
+    def set_genero_vista(self, view: str):
+        if view in gender_views:
+            self.genero_vista = view
+
+    @rx.event
+    def set_genero_filtro(self, dim: str, value: str):
+        if dim in gender_views:
+            self.genero_filtros = {**self.genero_filtros, dim: value}
+
+    @rx.event
+    def clear_genero_filtros(self):
+        self.genero_filtros = {dim: todos for dim in gender_dimensions}
+
+    def _genero_filters(self) -> dict[str, list[str]]:
+        return {
+            dim: [value]
+            for dim, value in self.genero_filtros.items()
+            if value != todos
+        }
+
+    @rx.var
+    def genero_opciones(self) -> dict[str, list[str]]:
+        """Valores de cada dimensión presentes en los datos."""
+        if not self.dataset_version:
+            return {dim: [] for dim in gender_dimensions}
+        cube = self._snapshot().genero
+        return {dim: cube.values(dim) for dim in gender_dimensions}
+
+    @rx.var
+    def genero_resumen(self) -> dict[str, int | float]:
+        """Totales y porcentajes dentro de los filtros."""
+        if not self.dataset_version:
+            return gender_shares(
+                {"publicaciones": 0, "lideradas": 0, "lideradas_mujeres": 0}
+            )
+        cube = self._snapshot().genero
+        return gender_shares(cube.totals(self._genero_filters()))
+
+    @rx.var
+    def genero_data(self) -> list[dict[str, str | int | float]]:
+        """Indicadores por valor de la dimensión elegida, como corte del cubo."""
+        if not self.dataset_version:
+            return []
+        cube = self._snapshot().genero
+        return [
+            gender_shares(row)
+            for row in cube.slice(self.genero_vista, self._genero_filters())
+        ]
+
+
+def _kpi(label: str, value: rx.Var, suffix: str = "") -> rx.Component:
+    return rx.card(
+        rx.vstack(
+            rx.text(label, size="2", class_name="text-gray-600"),
+            rx.heading(value, suffix, size="7", class_name="text-purple-900"),
+            spacing="1",
+        ),
+        class_name="flex-1 min-w-[200px]",
+    )
+
+
+def _filtro(dim: str) -> rx.Component:
+    return rx.vstack(
+        rx.text(gender_views[dim], size="2", weight="medium"),
+        rx.select.root(
+            rx.select.trigger(variant="soft"),
+            rx.select.content(
+                rx.select.item("Todos", value=todos),
+                rx.foreach(
+                    GeneroState.genero_opciones[dim],
+                    lambda value: rx.select.item(value, value=value),
+                ),
+            ),
+            value=GeneroState.genero_filtros[dim],
+            on_change=lambda value: GeneroState.set_genero_filtro(dim, value),
+        ),
+        spacing="1",
+    )
+
+
+def _genero_chart() -> rx.Component:
+    return rx.recharts.bar_chart(
+        rx.recharts.legend(),
+        rx.recharts.graphing_tooltip(),
+        rx.recharts.cartesian_grid(),
+        rx.recharts.bar(
+            data_key="pct_mujeres",
+            name="% del total liderado por mujeres",
+            stroke="#8E4EC6",
+            fill="#8e4ec6a9",
+        ),
+        rx.recharts.bar(
+            data_key="pct_lideradas",
+            name="% de las lideradas que lidera una mujer",
+            stroke="#3E63DD",
+            fill="#3e63dda9",
+        ),
+        rx.recharts.x_axis(data_key=GeneroState.genero_vista),
+        rx.recharts.y_axis(type_="number", domain=[0, 100], unit="%"),
+        data=GeneroState.genero_data,
+        min_height=350,
+    )
+
+
+def _genero_table() -> rx.Component:
+    return rx.table.root(
+        rx.table.header(
+            rx.table.row(
+                rx.table.column_header_cell(
+                    rx.match(
+                        GeneroState.genero_vista,
+                        *[(dim, label) for dim, label in gender_views.items()],
+                        "",
+                    )
+                ),
+                rx.table.column_header_cell("Publicaciones"),
+                rx.table.column_header_cell("Lideradas"),
+                rx.table.column_header_cell("Lideradas por mujeres"),
+                rx.table.column_header_cell("% del total"),
+                rx.table.column_header_cell("% de las lideradas"),
+            ),
+        ),
+        rx.table.body(
+            rx.foreach(
+                GeneroState.genero_data,
+                lambda row: rx.table.row(
+                    rx.table.row_header_cell(row[GeneroState.genero_vista]),
+                    rx.table.cell(row["publicaciones"]),
+                    rx.table.cell(row["lideradas"]),
+                    rx.table.cell(row["lideradas_mujeres"]),
+                    rx.table.cell(row["pct_mujeres"], "%"),
+                    rx.table.cell(row["pct_lideradas"], "%"),
+                ),
+            ),
+        ),
+        variant="surface",
+        size="2",
+        width="100%",
+    )
+
+
+def indicadores_genero() -> rx.Component:
+    return rx.vstack(
+        rx.heading(
+            "Publicaciones lideradas por investigadoras",
+            size="6",
+            class_name="text-indigo-900",
+        ),
+        rx.flex(
+            _kpi("Publicaciones", GeneroState.genero_resumen["publicaciones"]),
+            _kpi(
+                "Lideradas por mujeres",
+                GeneroState.genero_resumen["lideradas_mujeres"],
+            ),
+            _kpi("% del total", GeneroState.genero_resumen["pct_mujeres"], "%"),
+            _kpi(
+                "% de las lideradas",
+                GeneroState.genero_resumen["pct_lideradas"],
+                "%",
+            ),
+            wrap="wrap",
+            spacing="4",
+            width="100%",
+        ),
+        rx.flex(
+            rx.vstack(
+                rx.text("Ver por", size="2", weight="medium"),
+                rx.select.root(
+                    rx.select.trigger(variant="soft"),
+                    rx.select.content(
+                        *[
+                            rx.select.item(label, value=dim)
+                            for dim, label in gender_views.items()
+                        ]
+                    ),
+                    value=GeneroState.genero_vista,
+                    on_change=GeneroState.set_genero_vista,
+                ),
+                spacing="1",
+            ),
+            *[_filtro(dim) for dim in gender_views],
+            rx.button(
+                rx.icon("trash", size=16),
+                "Quitar filtros",
+                variant="soft",
+                color_scheme="tomato",
+                on_click=GeneroState.clear_genero_filtros,
+                class_name="self-end",
+            ),
+            wrap="wrap",
+            spacing="4",
+            width="100%",
+        ),
+        _genero_chart(),
+        _genero_table(),
+        spacing="5",
+        width="100%",
+    )
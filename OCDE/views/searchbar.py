@@ -34,18 +34,18 @@ def navbar_searchbar() -> rx.Component:
                 rx.input(
                     rx.input.slot(rx.icon("search")),
                     rx.input.slot(
-                        rx.icon("x", on_click=lambda: State.set_search_term("")),
+                        rx.icon("x", on_click=State.clear_search("search_term")),
                         justify="end",
                         cursor="pointer",
                     ),
-                    value=State.search_term,
+                    value=State.search_term_input,
                     placeholder="Buscar Investigadoras",
                     size="2",
                     max_width="250px",
                     width="100%",
                     variant="classic",
                     color_scheme="indigo",
-                    on_change=lambda val: State.set_search_term(val),
+                    on_change=lambda val: State.type_search("search_term", val),
                 ),
                 justify="between",
                 align_items="center",
@@ -81,7 +81,7 @@ def navbar_searchbar() -> rx.Component:
                         justify="end",
                         cursor="pointer",
                     ),
-                    value=State.search_term,
+                    value=State.search_term_input,
                     placeholder="Buscar...",
                     size="1",
                     type="search",
@@ -89,7 +89,7 @@ def navbar_searchbar() -> rx.Component:
                     width="50%",
                     variant="surface",
                     color_scheme="gray",
-                    on_change=lambda val: State.set_search_term(val),
+                    on_change=lambda val: State.type_search("search_term", val),
                 ),
                 justify="between",
                 align_items="center",
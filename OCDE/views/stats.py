@@ -1,10 +1,21 @@
 import reflex as rx
 from ..backend.backend import State
+from ..backend.stats import filter_dimensions
 from ..components.stats_selector import stats_selector
 
 
-class StatsState(rx.State):
-    stats_view: str = "age_salary"
+# Vistas del gráfico: dimensión del cubo → nombre en el selector
+stats_views = {
+    "año": "Por año",
+    "disciplina": "Por disciplina",
+    "unidad": "Por unidad",
+    "tipo_proyecto": "Por tipo de proyecto",
+    "cuartil": "Por cuartil",
+}
+
+
+class StatsState(State):
+    stats_view: str = "año"
     radar_toggle: bool = False
     area_toggle: bool = False
 
@@ -14,204 +25,96 @@ class StatsState(rx.State):
     def toggle_areachart(self):
         self.area_toggle = not self.area_toggle
 
-
-# def _age_salary_chart() -> rx.Component:
-#     return rx.cond(
-#         StatsState.area_toggle,
-#         rx.recharts.area_chart(
-#             rx.recharts.legend(),
-#             rx.recharts.graphing_tooltip(cursor=False),
-#             rx.recharts.cartesian_grid(),
-#             rx.recharts.area(
-#                 type_="monotone",
-#                 data_key="average salary",
-#                 stroke="#30A46C",
-#                 fill="#5bb98bb3",
-#             ),
-#             rx.recharts.x_axis(data_key="age"),
-#             rx.recharts.y_axis(type_="number", scale="auto", hide=True),
-#             data=State.get_age_salary_chart_data,
-#             min_height=325,
-#         ),
-#         rx.recharts.bar_chart(
-#             rx.recharts.legend(),
-#             rx.recharts.graphing_tooltip(),
-#             rx.recharts.cartesian_grid(),
-#             rx.recharts.bar(
-#                 data_key="average salary", stroke="#30A46C", fill="#5bb98bb3"
-#             ),
-#             rx.recharts.x_axis(data_key="age"),
-#             rx.recharts.y_axis(type_="number", scale="auto", hide=True),
-#             data=State.get_age_salary_chart_data,
-#             min_height=325,
-#         ),
-#     )
-
-
-# def _position_salary_chart() -> rx.Component:
-#     return rx.cond(
-#         StatsState.radar_toggle,
-#         rx.recharts.radar_chart(
-#             rx.recharts.legend(),
-#             rx.recharts.graphing_tooltip(cursor=False),
-#             rx.recharts.radar(
-#                 data_key="average salary",
-#                 stroke="#0090FF",
-#                 fill="#0091ffa1",
-#             ),
-#             rx.recharts.polar_grid(),
-#             rx.recharts.polar_angle_axis(data_key="position"),
-#             data=State.get_position_salary_chart_data,
-#             min_height=325,
-#         ),
-#         rx.recharts.bar_chart(
-#             rx.recharts.legend(),
-#             rx.recharts.graphing_tooltip(),
-#             rx.recharts.cartesian_grid(),
-#             rx.recharts.bar(
-#                 data_key="average salary", stroke="#0090FF", fill="#0091ffa1"
-#             ),
-#             rx.recharts.x_axis(data_key="position"),
-#             rx.recharts.y_axis(type_="number", scale="auto", hide=True),
-#             data=State.get_position_salary_chart_data,
-#             min_height=325,
-#         ),
-#     )
-
-
-# def _team_salary_chart() -> rx.Component:
-#     return rx.cond(
-#         StatsState.area_toggle,
-#         rx.recharts.area_chart(
-#             rx.recharts.legend(),
-#             rx.recharts.graphing_tooltip(cursor=False),
-#             rx.recharts.cartesian_grid(),
-#             rx.recharts.area(
-#                 type_="monotone",
-#                 data_key="average salary",
-#                 stroke="#8E4EC6",
-#                 fill="#8e4ec6a9",
-#             ),
-#             rx.recharts.brush(data_key="name", height=30, stroke="#8E4EC6"),
-#             rx.recharts.x_axis(data_key="team"),
-#             rx.recharts.y_axis(type_="number", scale="auto", hide=True),
-#             data=State.get_team_salary_chart_data,
-#             min_height=325,
-#         ),
-#         rx.recharts.bar_chart(
-#             rx.recharts.legend(),
-#             rx.recharts.graphing_tooltip(cursor=False),
-#             rx.recharts.cartesian_grid(),
-#             rx.recharts.bar(
-#                 data_key="average salary",
-#                 stroke="#8E4EC6",
-#                 fill="#8e4ec6a9",
-#             ),
-#             rx.recharts.brush(data_key="name", height=30, stroke="#8E4EC6"),
-#             rx.recharts.x_axis(data_key="team"),
-#             rx.recharts.y_axis(type_="number", scale="auto", hide=True),
-#             data=State.get_team_salary_chart_data,
-#             min_height=325,
-#         ),
-#     )
+    @rx.event
+    def set_stats_view(self, view: str):
+        if view in stats_views:
+            self.stats_view = view
+
+    @rx.event
+    async def load_stats(self):
+        """Marca todos los valores de los filtros en la primera visita."""
+        cube = (await self._load_dataset()).estadisticas
+        if not any(self.selected_items.values()):
+            self.selected_items = {
+                key: cube.values(dim) for key, dim in filter_dimensions.items()
+            }
+
+    @rx.var
+    def chart_data(self) -> list[dict[str, str | int]]:
+        """Totales de la vista elegida, como un corte del cubo."""
+        if not self.dataset_version:
+            return []
+        filters = {
+            filter_dimensions[key]: values
+            for key, values in self.selected_items.items()
+            if key in filter_dimensions
+        }
+        return self._snapshot().estadisticas.slice(self.stats_view, filters)
+
+
+def _bar_chart() -> rx.Component:
+    return rx.recharts.bar_chart(
+        rx.recharts.legend(),
+        rx.recharts.graphing_tooltip(),
+        rx.recharts.cartesian_grid(),
+        rx.recharts.bar(data_key="proyectos", stroke="#8E4EC6", fill="#8e4ec6a9"),
+        rx.recharts.bar(data_key="publicaciones", stroke="#3E63DD", fill="#3e63dda9"),
+        rx.recharts.x_axis(data_key=StatsState.stats_view),
+        rx.recharts.y_axis(type_="number", scale="auto"),
+        data=StatsState.chart_data,
+        min_height=325,
+    )
 
 
-# def _college_salary_chart() -> rx.Component:
-#     return rx.cond(
-#         StatsState.area_toggle,
-#         rx.recharts.area_chart(
-#             rx.recharts.legend(),
-#             rx.recharts.graphing_tooltip(cursor=False),
-#             rx.recharts.cartesian_grid(),
-#             rx.recharts.area(
-#                 type_="monotone",
-#                 data_key="average salary",
-#                 stroke="#fdc313",
-#                 fill="#ffc720a3",
-#             ),
-#             rx.recharts.brush(data_key="name", height=30, stroke="#fdc313"),
-#             rx.recharts.x_axis(data_key="college"),
-#             rx.recharts.y_axis(type_="number", scale="auto", hide=True),
-#             data=State.get_college_salary_chart_data,
-#             min_height=325,
-#         ),
-#         rx.recharts.bar_chart(
-#             rx.recharts.legend(),
-#             rx.recharts.graphing_tooltip(),
-#             rx.recharts.cartesian_grid(),
-#             rx.recharts.bar(
-#                 data_key="average salary", stroke="#fdc313", fill="#ffc720a3"
-#             ),
-#             rx.recharts.brush(data_key="name", height=30, stroke="#fdc313"),
-#             rx.recharts.x_axis(data_key="college"),
-#             rx.recharts.y_axis(type_="number", scale="auto", hide=True),
-#             data=State.get_college_salary_chart_data,
-#             min_height=325,
-#         ),
-#     )
+def _area_chart() -> rx.Component:
+    return rx.recharts.area_chart(
+        rx.recharts.legend(),
+        rx.recharts.graphing_tooltip(cursor=False),
+        rx.recharts.cartesian_grid(),
+        rx.recharts.area(
+            type_="monotone",
+            data_key="proyectos",
+            stroke="#8E4EC6",
+            fill="#8e4ec6a9",
+        ),
+        rx.recharts.area(
+            type_="monotone",
+            data_key="publicaciones",
+            stroke="#3E63DD",
+            fill="#3e63dda9",
+        ),
+        rx.recharts.x_axis(data_key=StatsState.stats_view),
+        rx.recharts.y_axis(type_="number", scale="auto"),
+        data=StatsState.chart_data,
+        min_height=325,
+    )
 
 
-# def _age_team_chart() -> rx.Component:
-#     return rx.cond(
-#         StatsState.area_toggle,
-#         rx.recharts.area_chart(
-#             rx.recharts.legend(),
-#             rx.recharts.graphing_tooltip(cursor=False),
-#             rx.recharts.cartesian_grid(),
-#             rx.recharts.area(
-#                 data_key="average age",
-#                 type_="monotone",
-#                 stroke="#FFA500",
-#                 fill="#ffa6009e",
-#             ),
-#             rx.recharts.brush(data_key="team", height=30, stroke="#FFA500"),
-#             rx.recharts.x_axis(data_key="team"),
-#             rx.recharts.y_axis(type_="number", scale="auto", hide=True),
-#             data=State.get_team_age_average_data,
-#             min_height=325,
-#         ),
-#         rx.recharts.bar_chart(
-#             rx.recharts.legend(),
-#             rx.recharts.graphing_tooltip(),
-#             rx.recharts.cartesian_grid(),
-#             rx.recharts.bar(data_key="average age", stroke="#FFA500", fill="#ffa6009e"),
-#             rx.recharts.brush(data_key="team", height=30, stroke="#FFA500"),
-#             rx.recharts.x_axis(data_key="team"),
-#             rx.recharts.y_axis(type_="number", scale="auto", hide=True),
-#             data=State.get_team_age_average_data,
-#             min_height=325,
-#         ),
-#     )
+def _radar_chart() -> rx.Component:
+    return rx.recharts.radar_chart(
+        rx.recharts.legend(),
+        rx.recharts.graphing_tooltip(cursor=False),
+        rx.recharts.radar(data_key="proyectos", stroke="#8E4EC6", fill="#8e4ec6a9"),
+        rx.recharts.radar(
+            data_key="publicaciones", stroke="#3E63DD", fill="#3e63dda9"
+        ),
+        rx.recharts.polar_grid(),
+        rx.recharts.polar_angle_axis(data_key=StatsState.stats_view),
+        data=StatsState.chart_data,
+        min_height=325,
+    )
 
 
-# def _age_position_chart() -> rx.Component:
-#     return rx.cond(
-#         StatsState.radar_toggle,
-#         rx.recharts.radar_chart(
-#             rx.recharts.legend(),
-#             rx.recharts.graphing_tooltip(),
-#             rx.recharts.radar(
-#                 data_key="average age",
-#                 stroke="#E54666",
-#                 fill="#e54666a0",
-#             ),
-#             rx.recharts.polar_grid(),
-#             rx.recharts.polar_angle_axis(data_key="position"),
-#             data=State.get_position_age_average_data,
-#             min_height=325,
-#         ),
-#         rx.recharts.bar_chart(
-#             rx.recharts.legend(),
-#             rx.recharts.graphing_tooltip(),
-#             rx.recharts.cartesian_grid(),
-#             rx.recharts.bar(data_key="average age", stroke="#E54666", fill="#e54666a0"),
-#             rx.recharts.brush(data_key="position", height=30, stroke="#E54666"),
-#             rx.recharts.x_axis(data_key="position"),
-#             rx.recharts.y_axis(type_="number", scale="auto", hide=True),
-#             data=State.get_position_age_average_data,
-#             min_height=325,
-#         ),
-#     )
+def _stats_chart() -> rx.Component:
+    return rx.match(
+        StatsState.stats_view,
+        (
+            "tipo_proyecto",
+            "cuartil",
+            rx.cond(StatsState.radar_toggle, _radar_chart(), _bar_chart()),
+        ),
+        rx.cond(StatsState.area_toggle, _area_chart(), _bar_chart()),
+    )
 
 
 def _radar_toggle() -> rx.Component:
@@ -265,39 +168,28 @@ def stats_ui() -> rx.Component:
         ),
         rx.vstack(
             rx.flex(
-                rx.select(
+                rx.select.root(
+                    rx.select.trigger(variant="soft"),
+                    rx.select.content(
+                        *[
+                            rx.select.item(label, value=view)
+                            for view, label in stats_views.items()
+                        ]
+                    ),
                     value=StatsState.stats_view,
-                    items=[
-                        "age_salary",
-                        "age_team",
-                        "age_position",
-                        "position_salary",
-                        "team_salary",
-                        "college_salary",
-                    ],
                     on_change=StatsState.set_stats_view,
                     size="3",
-                    variant="soft",
-                    justify_content="end",
                 ),
                 rx.match(
                     StatsState.stats_view,
-                    ("position_salary", "age_position", _radar_toggle()),
+                    ("tipo_proyecto", "cuartil", _radar_toggle()),
                     (_area_toggle()),
                 ),
                 margin_bottom=["2em", "2em", "4em"],
                 spacing="4",
                 width="100%",
             ),
-            # rx.match(
-            #     StatsState.stats_view,
-            #     ("age_salary", _age_salary_chart()),
-            #     ("age_team", _age_team_chart()),
-            #     ("age_position", _age_position_chart()),
-            #     ("position_salary", _position_salary_chart()),
-            #     ("team_salary", _team_salary_chart()),
-            #     ("college_salary", _college_salary_chart()),
-            # ),
+            _stats_chart(),
             width="100%",
             justify="center",
             padding_x=["0em", "0em", "0em", "0em", "6em"],
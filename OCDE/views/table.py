@@ -1,5 +1,6 @@
 import reflex as rx
 from ..backend.backend import State, Proyectos, Publicaciones
+from .exportar import export_menu
 # from ..backend.data_items import teams_dict, position_dict
 from ..backend.data_items import años_dict, disciplinas_dict, unidades_dict
 
@@ -16,6 +17,31 @@ def _header_cell(text: str, icon: str) -> rx.Component:
     )
 
 
+def _sort_header_cell(text: str, icon: str, table: str, column: str) -> rx.Component:
+    sort_value = getattr(State, f"sort_value_{table}")
+    sort_reverse = getattr(State, f"sort_reverse_{table}")
+    return rx.table.column_header_cell(
+        rx.hstack(
+            rx.icon(icon, size=20),
+            rx.text(text, size="3"),
+            rx.cond(
+                sort_value == column,
+                rx.cond(
+                    sort_reverse,
+                    rx.icon("arrow-down-wide-narrow", size=16),
+                    rx.icon("arrow-up-narrow-wide", size=16),
+                ),
+                rx.icon("arrow-up-down", size=16, opacity=0.5),
+            ),
+            align="center",
+            spacing="2",
+            class_name="text-indigo-900 font-semibold",
+        ),
+        on_click=State.toggle_sort(table, column),
+        cursor="pointer",
+    )
+
+
 def _show_player(proyectos: Proyectos, index: int) -> rx.Component:
 
     return rx.table.row(
@@ -37,6 +63,7 @@ def _show_pub(publicaciones: Publicaciones, index: int) -> rx.Component:
         rx.table.row_header_cell(publicaciones.año),
         rx.table.cell(publicaciones.titulo),
         rx.table.cell(publicaciones.revista),
+        rx.table.cell(publicaciones.cuartil),
         rx.table.cell(rx.button(
             "publicación", 
             size="1",
@@ -62,60 +89,61 @@ def _show_pub(publicaciones: Publicaciones, index: int) -> rx.Component:
     )
 
 
-# def _pagination_view() -> rx.Component:
-#     return (
-#         rx.hstack(
-#             rx.text(
-#                 "Página ",
-#                 rx.code(State.page_number),
-#                 f" de {State.total_pages}",
-#                 justify="end",
-#                 class_name="text-gray-700",
-#             ),
-#             rx.hstack(
-#                 rx.icon_button(
-#                     rx.icon("chevrons-left", size=18),
-#                     on_click=State.first_page,
-#                     opacity=rx.cond(State.page_number == 1, 0.6, 1),
-#                     color_scheme=rx.cond(State.page_number == 1, "gray", "accent"),
-#                     variant="solid",
-#                 ),
-#                 rx.icon_button(
-#                     rx.icon("chevron-left", size=18),
-#                     on_click=State.prev_page,
-#                     opacity=rx.cond(State.page_number == 1, 0.6, 1),
-#                     color_scheme=rx.cond(State.page_number == 1, "gray", "accent"),
-#                     variant="solid",
-#                 ),
-#                 rx.icon_button(
-#                     rx.icon("chevron-right", size=18),
-#                     on_click=State.next_page,
-#                     opacity=rx.cond(State.page_number == State.total_pages, 0.6, 1),
-#                     color_scheme=rx.cond(
-#                         State.page_number == State.total_pages, "gray", "accent"
-#                     ),
-#                     variant="solid",
-#                 ),
-#                 rx.icon_button(
-#                     rx.icon("chevrons-right", size=18),
-#                     on_click=State.last_page,
-#                     opacity=rx.cond(State.page_number == State.total_pages, 0.6, 1),
-#                     color_scheme=rx.cond(
-#                         State.page_number == State.total_pages, "gray", "accent"
-#                     ),
-#                     variant="solid",
-#                 ),
-#                 align="center",
-#                 spacing="2",
-#                 justify="end",
-#             ),
-#             spacing="5",
-#             margin_top="1em",
-#             align="center",
-#             width="100%",
-#             justify="end",
-#         ),
-#     )
+def _pagination_view(table: str) -> rx.Component:
+    page_number = getattr(State, f"page_number_{table}")
+    total_pages = getattr(State, f"total_pages_{table}")
+    return rx.hstack(
+        rx.text(
+            "Página ",
+            rx.code(page_number),
+            f" de {total_pages}",
+            justify="end",
+            class_name="text-gray-700",
+        ),
+        rx.hstack(
+            rx.icon_button(
+                rx.icon("chevrons-left", size=18),
+                on_click=State.first_page(table),
+                opacity=rx.cond(page_number == 1, 0.6, 1),
+                color_scheme=rx.cond(page_number == 1, "gray", "accent"),
+                variant="solid",
+            ),
+            rx.icon_button(
+                rx.icon("chevron-left", size=18),
+                on_click=State.prev_page(table),
+                opacity=rx.cond(page_number == 1, 0.6, 1),
+                color_scheme=rx.cond(page_number == 1, "gray", "accent"),
+                variant="solid",
+            ),
+            rx.icon_button(
+                rx.icon("chevron-right", size=18),
+                on_click=State.next_page(table),
+                opacity=rx.cond(page_number == total_pages, 0.6, 1),
+                color_scheme=rx.cond(
+                    page_number == total_pages, "gray", "accent"
+                ),
+                variant="solid",
+            ),
+            rx.icon_button(
+                rx.icon("chevrons-right", size=18),
+                on_click=State.last_page(table),
+                opacity=rx.cond(page_number == total_pages, 0.6, 1),
+                color_scheme=rx.cond(
+                    page_number == total_pages, "gray", "accent"
+                ),
+                variant="solid",
+            ),
+            align="center",
+            spacing="2",
+            justify="end",
+        ),
+        export_menu("proyectos" if table == "proy" else "publicaciones"),
+        spacing="5",
+        margin_top="1em",
+        align="center",
+        width="100%",
+        justify="end",
+    )
 
 
 class EventArgState(rx.State):
@@ -136,17 +164,17 @@ def main_table() -> rx.Component:
                     rx.icon("x"),
                     justify="end",
                     cursor="pointer",
-                    on_click=State.setvar("search_value_proy", ""),
-                    display=rx.cond(State.search_value_proy, "flex", "none"),
+                    on_click=State.clear_search("search_value_proy"),
+                    display=rx.cond(State.search_value_proy_input, "flex", "none"),
                 ),
-                value=State.search_value_proy,
+                value=State.search_value_proy_input,
                 placeholder="Buscar aquí...",
                 size="3",
                 max_width="250px",
                 width="100%",
                 variant="surface",
                 color_scheme="gray",
-                on_change=State.set_search_value_proy,
+                on_change=lambda val: State.type_search("search_value_proy", val),
             ),
             align="center",
             justify="end",
@@ -159,10 +187,10 @@ def main_table() -> rx.Component:
             rx.table.header(
                 rx.table.row(
                     _header_cell("Código", "text-search"),
-                    _header_cell("Título", "notebook-pen"),
-                    _header_cell("Año", "calendar"),
+                    _sort_header_cell("Título", "notebook-pen", "proy", "titulo"),
+                    _sort_header_cell("Año", "calendar", "proy", "año"),
                     _header_cell("Disciplina", "user-round-search"),
-                    _header_cell("Tipo proyecto", "filter"),
+                    _sort_header_cell("Tipo proyecto", "filter", "proy", "tipo_proyecto"),
                     _header_cell("Rol", "building"),
                 ),
                 class_name="w-full bg-indigo-400",
@@ -178,7 +206,7 @@ def main_table() -> rx.Component:
             size="2",
             width="100%",
         ),
-        # _pagination_view(),
+        _pagination_view("proy"),
     )
 
 #Tabla de publicaciones
@@ -191,17 +219,17 @@ def pub_table() -> rx.Component:
                     rx.icon("x"),
                     justify="end",
                     cursor="pointer",
-                    on_click=State.setvar("search_value_pub", ""),
-                    display=rx.cond(State.search_value_pub, "flex", "none"),
+                    on_click=State.clear_search("search_value_pub"),
+                    display=rx.cond(State.search_value_pub_input, "flex", "none"),
                 ),
-                value=State.search_value_pub,
+                value=State.search_value_pub_input,
                 placeholder="Buscar aquí...",
                 size="3",
                 max_width="250px",
                 width="100%",
                 variant="surface",
                 color_scheme="indigo",
-                on_change=State.set_search_value_pub,
+                on_change=lambda val: State.type_search("search_value_pub", val),
             ),
             align="center",
             justify="end",
@@ -213,9 +241,10 @@ def pub_table() -> rx.Component:
         rx.table.root(
             rx.table.header(
                 rx.table.row(
-                    _header_cell("Año", "calendar"),
-                    _header_cell("Título", "notebook-pen"),
-                    _header_cell("Revista", "book-open-text"),
+                    _sort_header_cell("Año", "calendar", "pub", "año"),
+                    _sort_header_cell("Título", "notebook-pen", "pub", "titulo"),
+                    _sort_header_cell("Revista", "book-open-text", "pub", "revista"),
+                    _sort_header_cell("Cuartil", "award", "pub", "cuartil"),
                     _header_cell("Link", "external-link"),
                     _header_cell("Altmetric", "badge"),
                 ),
@@ -232,6 +261,5 @@ def pub_table() -> rx.Component:
             size="2",
             class_name="w-full",
         ),
-        # _pagination_view(),
-        
+        _pagination_view("pub"),
     )
\ No newline at end of file
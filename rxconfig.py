@@ -1,3 +1,5 @@
+import os
+
 import reflex as rx
 
 config = rx.Config(
@@ -5,5 +7,5 @@ config = rx.Config(
     plugins=[
         rx.plugins.TailwindV4Plugin(),
     ],
-    db_url=None,
+    db_url=os.getenv("DB_URL"),
 )
\ No newline at end of file